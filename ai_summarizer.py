@@ -4,14 +4,201 @@
 支持 Claude, Gemini, OpenAI 等多种 LLM
 """
 
+import hashlib
+import importlib.util
+import json
+import logging
 import os
-from typing import Dict, Optional
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
+
+from disk_cache import DiskCache, SemanticCache
+
+try:
+    import openai
+except ImportError:
+    openai = None
+
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+logger = logging.getLogger(__name__)
+
+# API 调用重试：对限流、超时、5xx 等瞬时错误做指数退避，认证/参数错误直接失败
+MAX_API_ATTEMPTS = 4
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504, 529}
+# 没有 HTTP 状态码的网络错误（连接失败、超时）
+RETRY_ERRORS = tuple(
+    module.APIConnectionError for module in (openai, anthropic) if module is not None
+)
+
+PAPER_SYSTEM = "你是 AI 研究助手，用中文简洁解读学术论文，重点突出创新点和实际价值。"
+
+# Claude 的系统提示词（固定不变的前缀，开启 prompt caching 后可在服务端复用）
+CLAUDE_PAPER_SYSTEM = PAPER_SYSTEM + """
+
+请用中文简要解读用户给出的论文，控制在 200-300 字，回答：
+1. **做了什么**：一句话概括核心工作
+2. **怎么做的**：关键方法（2-3 句）
+3. **效果如何**：主要结果
+4. **为什么重要**：对领域的意义
+
+简洁直接，不要客套话。"""
+
+# 各 provider 不同速度档位的默认模型：fast 延迟低、成本低，适合短输出；quality 效果最好
+MODEL_TIERS = {
+    'claude': {
+        'fast': 'claude-3-5-haiku-20241022',
+        'balanced': 'claude-sonnet-4-20250514',
+        'quality': 'claude-opus-4-20250514'
+    },
+    'gemini': {
+        'fast': 'gemini-2.0-flash-lite',
+        'balanced': 'gemini-2.0-flash-exp',
+        'quality': 'gemini-2.5-pro'
+    },
+    'openai': {
+        'fast': 'gpt-4o-mini',
+        'balanced': 'gpt-4o',
+        'quality': 'gpt-4.1'
+    }
+}
+
+# ============ 提示词模板（模块级常量，每次调用只做字段替换） ============
+
+# OpenAI 兼容接口的论文解读提示词
+PAPER_PROMPT_TEMPLATE = """请用中文简要解读以下论文，控制在 200-300 字：
+{context_section}
+**标题**: {title}
+**作者**: {authors}
+**摘要**: {summary}
+
+请回答：
+1. **做了什么**：一句话概括核心工作
+2. **怎么做的**：关键方法（2-3 句）
+3. **效果如何**：主要结果
+4. **为什么重要**：对领域的意义{context_hint}
+
+简洁直接，不要客套话。"""
+
+PAPER_CONTEXT_TEMPLATE = """
+**昨日推送摘要**（请参考，体现研究延续性）:
+{prev_context}
+
+"""
+
+# 多篇论文合并为一次请求的提示词（论文之间以 --- 分隔，要求返回 JSON 对象）
+PAPER_COMBINED_PROMPT_TEMPLATE = """请用中文分别简要解读以下 {count} 篇论文，每篇控制在 200-300 字：
+{context_section}
+{papers}
+
+每篇请回答：
+1. **做了什么**：一句话概括核心工作
+2. **怎么做的**：关键方法（2-3 句）
+3. **效果如何**：主要结果
+4. **为什么重要**：对领域的意义{context_hint}
+
+简洁直接，不要客套话。只返回 JSON 对象，格式为：
+{{"summaries": [{{"index": 论文编号, "summary": "解读内容（Markdown）"}}, ...]}}"""
+
+PAPER_COMBINED_ITEM_TEMPLATE = """[{index}]
+**标题**: {title}
+**作者**: {authors}
+**摘要**: {summary}"""
+
+# Claude 的论文用户消息（指令部分在系统提示词中）
+PAPER_INPUT_TEMPLATE = """**标题**: {title}
+**作者**: {authors}
+**摘要**: {summary}"""
+
+# 博客摘要的用户消息（指令部分在系统提示词中）
+BLOG_INPUT_TEMPLATE = """**标题**: {title}
+**来源**: {source}
+
+**内容**:
+{content}"""
+
+CLASSIC_SYSTEM = "你是 AI 研究助手，擅长解读经典论文的历史意义和当代价值。"
+
+CLASSIC_PROMPT_TEMPLATE = """请用中文解读这篇经典论文，100-150 字：
+
+**标题**: {title} ({year})
+**作者**: {authors}
+**简介**: {description}
+**关键词**: {keywords}
+
+请回答：
+1. **历史地位**：这篇论文在 AI 发展史上的位置
+2. **核心贡献**：最关键的创新点
+3. **当今影响**：对今天的研究/工业界还有什么影响
+
+简洁直接。"""
+
+TREND_SYSTEM = "你是一个 AI 研究趋势分析师，擅长从大量研究内容中提炼关键趋势。"
+
+# 输出长度上限：论文解读约 200-300 字、博客约 150-200 字，留少量余量即可
+# Claude / Gemini 的论文解读上限从 2000 收紧到 900；OpenAI 兼容接口（含中转）原本就是 800，保持不变
+PAPER_MAX_TOKENS = 900
+OPENAI_PAPER_MAX_TOKENS = 800
+BLOG_MAX_TOKENS = 500
+
+# 合并摘要每次请求最多包含的论文数（输出上限为单篇上限 * 篇数，需低于模型的输出上限）
+COMBINED_CHUNK_SIZE = 6
+
+# 博客正文输入上限：按 token 截断，中英文内容占用的上下文预算一致
+BLOG_INPUT_TOKENS = 2500
+# 未安装 tiktoken 时退化为按字符截断
+BLOG_INPUT_CHARS = 2000
+
+# 进程内 LRU 缓存容量（挡在磁盘缓存前面，同一次运行中的重复请求不再查询 sqlite）
+MEMORY_CACHE_SIZE = 512
+
+# 论文 ID 缓存的提示词版本号：修改论文提示词后递增，使旧的按 ID 缓存的解读失效
+PAPER_PROMPT_VERSION = 1
+
+# 博客语义缓存阈值：同一篇博客标题常有细微改动（转载、修订），比论文缓存略宽松
+BLOG_SEMANTIC_THRESHOLD = 0.92
+# 博客语义缓存 key 中包含的正文字符数：同一来源标题几乎相同的不同文章（如 "Weekly update #41" / "#42"）
+# 只有正文能区分，只比较标题会互相串用摘要
+BLOG_SEMANTIC_CONTENT_CHARS = 1000
+
+# 博客摘要的系统提示词（Claude 和 OpenAI 兼容接口共用）
+BLOG_SYSTEM = """你是一个 AI 研究助手，擅长总结和分析技术博客文章。
+
+请用中文简要总结用户给出的博客，控制在 150-200 字，回答：
+1. **核心观点**：文章主要说了什么（1-2 句）
+2. **关键发现**：最重要的信息或结论
+3. **值得关注**：对 AI 从业者的启发
+
+简洁直接。"""
 
 
 class AISummarizer:
     """AI 摘要生成器"""
 
-    def __init__(self, provider: str = "claude", api_key: str = None, model: str = None):
+    def __init__(self, provider: str = "claude", api_key: str = None, model: str = None,
+                 cache_ttl: float = 30 * 86400, speed_tier: str = 'balanced', warmup: bool = True,
+                 enable_semantic_cache: bool = False):
         """
         初始化摘要生成器
 
@@ -19,21 +206,55 @@ class AISummarizer:
             provider: 提供商 (claude, gemini, openai)
             api_key: API 密钥
             model: 模型名称
+            cache_ttl: 摘要磁盘缓存的过期时间（秒），0 或 None 表示禁用缓存
+            speed_tier: 未指定 model 时的默认模型档位 (fast, balanced, quality)
+            warmup: 是否在后台预先建立到 API 的 HTTPS 连接
+            enable_semantic_cache: 是否启用语义缓存（标题+摘要高度相似的论文、标题+来源+正文高度相似的博客直接复用解读，需要额外加载 embedding 模型）
         """
         self.provider = provider
-        self.api_key = api_key or os.getenv('CLAUDE_API_KEY', '') if provider == 'claude' else \
-                       os.getenv('GEMINI_API_KEY', '') if provider == 'gemini' else \
-                       os.getenv('OPENAI_API_KEY', '')
+        self.api_key = api_key or (os.getenv('CLAUDE_API_KEY', '') if provider == 'claude' else
+                                   os.getenv('GEMINI_API_KEY', '') if provider == 'gemini' else
+                                   os.getenv('OPENAI_API_KEY', ''))
+
+        # 默认模型配置：按 speed_tier 选择档位
+        tiers = MODEL_TIERS.get(provider, MODEL_TIERS['claude'])
+        if speed_tier not in tiers:
+            logger.warning("⚠️  未知的 speed_tier: %s，使用 balanced", speed_tier)
+            speed_tier = 'balanced'
+
+        # 短输出任务（经典论文解读）使用的模型；显式指定 model 时不做替换
+        self._fast_model = model or tiers['fast']
 
-        # 默认模型配置
         if model is None:
-            model = {
-                'claude': 'claude-sonnet-4-20250514',
-                'gemini': 'gemini-2.0-flash-exp',
-                'openai': 'gpt-4o'
-            }.get(provider, 'claude-sonnet-4-20250514')
+            model = tiers[speed_tier]
 
         self.model = model
+        self.speed_tier = speed_tier
+
+        # 运行期间固定不变的配置，初始化时计算一次
+        self._base_url = self._normalize_base_url(os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1'))
+        # 配置了 OPENAI_BASE_URL 时视为使用中转服务（如用 OpenAI 兼容接口转发 Claude）
+        self._use_relay = bool(os.getenv('OPENAI_BASE_URL'))
+        self._ai_label = self._compute_ai_label(model)
+
+        # 磁盘缓存：相同 prompt 跨运行直接复用结果，不再重复调用 API
+        self._cache = DiskCache('summaries', ttl=cache_ttl) if cache_ttl else None
+        self._memory_cache = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+
+        # 语义缓存按 provider + 模型区分，不同模型生成的解读互不复用
+        self._semantic_cache = None
+        self._blog_semantic_cache = None
+        if enable_semantic_cache:
+            name = 'semantic_' + hashlib.sha256(f'{provider}:{model}'.encode('utf-8')).hexdigest()[:12]
+            self._semantic_cache = SemanticCache(name)
+            # v2：key 加入正文后与旧索引（只含标题+来源）不兼容，换用新的缓存文件
+            self._blog_semantic_cache = SemanticCache(name.replace('semantic_', 'semantic_blog_v2_', 1),
+                                                      threshold=BLOG_SEMANTIC_THRESHOLD)
+
+        # 后台预热连接，第一次生成摘要时 TCP/TLS 握手已经完成
+        if warmup and self.api_key and self.provider in ('openai', 'claude'):
+            threading.Thread(target=self._warmup, daemon=True).start()
 
     def summarize_paper(self, paper: Dict, use_hf_summary: bool = False, prev_context: str = None) -> Optional[str]:
         """
@@ -51,24 +272,203 @@ class AISummarizer:
             return f"📌 **HF AI 摘要**:\n{paper['ai_summary']}"
 
         if not self.api_key:
-            print(f"⚠️  未配置 {self.provider} API key")
+            logger.warning("⚠️  未配置 %s API key", self.provider)
             return None
 
+        # 同一篇论文跨天重复出现时按 ID 直接复用解读（prompt 中的前一天上下文每天都不同，按 prompt 缓存无法命中）
+        id_key = self._paper_cache_key(paper)
+        if id_key is not None:
+            cached = self._cache_lookup(id_key)
+            if cached is not None:
+                logger.debug("  ✅ 命中论文 ID 缓存")
+                return cached
+
+        semantic_key = None
+        if self._semantic_cache is not None:
+            semantic_key = f"{paper['title']}\n{paper['summary']}"
+            cached = self._semantic_cache.get(semantic_key)
+            if cached is not None:
+                logger.debug("  ✅ 命中语义缓存")
+                return cached
+
         try:
             if self.provider == 'openai':
-                return self._summarize_with_openai(paper, prev_context)
+                summary = self._summarize_with_openai(paper, prev_context)
             elif self.provider == 'claude':
-                return self._summarize_with_claude(paper)
+                summary = self._summarize_with_claude(paper)
             elif self.provider == 'gemini':
-                return self._summarize_with_gemini(paper)
+                summary = self._summarize_with_gemini(paper)
             else:
-                print(f"⚠️  不支持的 provider: {self.provider}")
+                logger.warning("⚠️  不支持的 provider: %s", self.provider)
                 return None
 
         except Exception as e:
-            print(f"⚠️  {self.provider} 摘要生成失败: {e}")
+            logger.warning("⚠️  %s 摘要生成失败: %s", self.provider, e)
             return None
 
+        if summary:
+            if id_key is not None:
+                self._cache_store(id_key, summary)
+            if semantic_key is not None:
+                self._semantic_cache.set(semantic_key, summary)
+        return summary
+
+    def summarize_papers_batch(self, papers: List[Dict], use_hf_summary: bool = False,
+                               prev_context: str = None, concurrency: int = 8) -> List[Optional[str]]:
+        """
+        并发为多篇论文生成摘要（每篇论文一次独立的 API 调用）
+
+        Args:
+            papers: 论文列表
+            use_hf_summary: 是否优先使用 HF 提供的简短摘要
+            prev_context: 前一天的推送摘要
+            concurrency: 最大并发请求数
+
+        Returns:
+            摘要列表，顺序与 papers 一致，失败的位置为 None
+        """
+        if not papers:
+            return []
+
+        def _summarize(paper):
+            return self.summarize_paper(paper, use_hf_summary=use_hf_summary, prev_context=prev_context)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(papers)))) as executor:
+            return list(executor.map(_summarize, papers))
+
+    def summarize_papers_combined(self, papers: List[Dict], prev_context: str = None) -> List[Optional[str]]:
+        """
+        把多篇论文合并为一次 API 调用生成摘要（省去重复的往返和指令 token）
+
+        已按论文 ID 缓存的论文不再发送，其余论文每 COMBINED_CHUNK_SIZE 篇合并为一次请求；
+        模型返回的 JSON 无法解析或缺少某篇时，缺失的论文退回 summarize_papers_batch 逐篇生成。
+        Gemini 不支持时直接逐篇生成。
+
+        Args:
+            papers: 论文列表
+            prev_context: 前一天的推送摘要
+
+        Returns:
+            摘要列表，顺序与 papers 一致，失败的位置为 None
+        """
+        if not papers:
+            return []
+        if not self.api_key:
+            logger.warning("⚠️  未配置 %s API key", self.provider)
+            return [None] * len(papers)
+        if self.provider not in ('openai', 'claude'):
+            return self.summarize_papers_batch(papers, prev_context=prev_context)
+
+        results: List[Optional[str]] = [None] * len(papers)
+        pending = []
+        for i, paper in enumerate(papers):
+            id_key = self._paper_cache_key(paper)
+            cached = self._cache_lookup(id_key) if id_key is not None else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        # 按固定大小分组发送：输出 token 上限随篇数线性增长，整组过大会超出模型的输出上限
+        chunks = [pending[k:k + COMBINED_CHUNK_SIZE] for k in range(0, len(pending), COMBINED_CHUNK_SIZE)]
+        chunks = [chunk for chunk in chunks if len(chunk) > 1]
+        if chunks:
+            def _request(chunk):
+                try:
+                    return self._summarize_combined_request([papers[i] for i in chunk], prev_context)
+                except Exception as e:
+                    logger.warning("⚠️  合并摘要失败，改为逐篇生成: %s", e)
+                    return {}
+
+            label = 'Claude 解读' if self.provider == 'claude' else self._ai_label
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                for chunk, parsed in zip(chunks, executor.map(_request, chunks)):
+                    for n, i in enumerate(chunk, 1):
+                        text = parsed.get(n)
+                        if text:
+                            results[i] = f"🤖 **{label}**:\n\n{text}"
+                            id_key = self._paper_cache_key(papers[i])
+                            if id_key is not None:
+                                self._cache_store(id_key, results[i])
+            pending = [i for i in pending if results[i] is None]
+
+        if pending:
+            fallback = self.summarize_papers_batch([papers[i] for i in pending], prev_context=prev_context)
+            for i, summary in zip(pending, fallback):
+                results[i] = summary
+        return results
+
+    def _summarize_combined_request(self, papers: List[Dict], prev_context: str = None) -> Dict[int, str]:
+        """发送合并请求，返回 {论文编号(从 1 开始): 解读文本}"""
+        prompt = PAPER_COMBINED_PROMPT_TEMPLATE.format_map({
+            'count': len(papers),
+            'context_section': PAPER_CONTEXT_TEMPLATE.format_map({'prev_context': prev_context}) if prev_context else '',
+            'context_hint': '，以及与昨日推送内容的关联' if prev_context else '',
+            'papers': '\n---\n'.join(
+                PAPER_COMBINED_ITEM_TEMPLATE.format_map({
+                    'index': n,
+                    'title': paper['title'],
+                    'authors': paper.get('author_str', 'N/A'),
+                    'summary': paper['summary']
+                })
+                for n, paper in enumerate(papers, 1)
+            )
+        })
+        if self.provider == 'claude':
+            text = self._chat_claude(PAPER_SYSTEM, prompt, PAPER_MAX_TOKENS * len(papers))
+        else:
+            text = self._chat_openai(PAPER_SYSTEM, prompt, OPENAI_PAPER_MAX_TOKENS * len(papers), json_mode=True)
+
+        # Claude 没有 JSON 模式，回复可能带有 ```json 代码块，只取最外层的 JSON 对象
+        data = json.loads(text[text.find('{'):text.rfind('}') + 1])
+        parsed = {}
+        for item in data.get('summaries', []):
+            try:
+                index = int(item['index'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            summary = item.get('summary')
+            if isinstance(summary, str) and summary.strip():
+                parsed[index] = summary.strip()
+        return parsed
+
+    def summarize_paper_stream(self, paper: Dict, prev_context: str = None) -> Iterator[str]:
+        """
+        流式生成论文摘要，边生成边返回文本片段（第一段为标签前缀）
+
+        与 summarize_paper 共用提示词和磁盘缓存：命中缓存时一次性返回完整结果，
+        流式生成结束后写入缓存（与 _chat_* 一样存去除首尾空白的文本）。调用失败时直接抛出异常，由调用方处理。
+
+        Args:
+            paper: 论文数据
+            prev_context: 前一天的推送摘要（仅 OpenAI 兼容接口使用）
+
+        Yields:
+            摘要文本片段
+        """
+        if self.provider == 'claude':
+            system, prompt, max_tokens = CLAUDE_PAPER_SYSTEM, self._build_claude_paper_input(paper), PAPER_MAX_TOKENS
+            label, stream = "Claude 解读", self._stream_claude
+        elif self.provider == 'openai':
+            system, prompt, max_tokens = PAPER_SYSTEM, self._build_prompt(paper, prev_context), OPENAI_PAPER_MAX_TOKENS
+            label, stream = self._ai_label, self._stream_openai
+        else:
+            raise ValueError(f"不支持流式输出的 provider: {self.provider}")
+
+        yield f"🤖 **{label}**:\n\n"
+
+        cache_key = self._cache_key(system, prompt, max_tokens, 0.7, title=paper['title'])
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        for text in stream(system, prompt, max_tokens):
+            chunks.append(text)
+            yield text
+        self._cache_store(cache_key, ''.join(chunks).strip())
+
     def summarize_blog(self, blog: Dict) -> Optional[str]:
         """
         为博客文章生成摘要
@@ -88,179 +488,130 @@ class AISummarizer:
         if not content or len(content) < 100:
             return None
 
+        semantic_key = None
+        if self._blog_semantic_cache is not None:
+            semantic_key = f"{blog.get('title', '')}\n{blog.get('source', '')}\n{content[:BLOG_SEMANTIC_CONTENT_CHARS]}"
+            cached = self._blog_semantic_cache.get(semantic_key)
+            if cached is not None:
+                logger.debug("  ✅ 命中博客语义缓存")
+                return cached
+
+        content = truncate_by_tokens(content, BLOG_INPUT_TOKENS)
+
         try:
             if self.provider == 'openai':
-                return self._summarize_blog_with_openai(blog, content)
+                summary = self._summarize_blog_with_openai(blog, content)
             elif self.provider == 'claude':
-                return self._summarize_blog_with_claude(blog, content)
+                summary = self._summarize_blog_with_claude(blog, content)
             elif self.provider == 'gemini':
-                return self._summarize_blog_with_openai(blog, content)
+                summary = self._summarize_blog_with_openai(blog, content)
             else:
                 return None
 
         except Exception as e:
-            print(f"  ⚠️  博客摘要生成失败: {e}")
-            return None
-
-    def summarize_classic_paper(self, paper: Dict) -> Optional[str]:
-        """为经典论文生成 AI 解读，聚焦历史意义"""
-        if not self.api_key:
+            logger.warning("  ⚠️  博客摘要生成失败: %s", e)
             return None
 
-        try:
-            import openai
-            base_url = os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1')
-            if not base_url.endswith('/v1'):
-                base_url = base_url.rstrip('/') + '/v1'
+        if summary and semantic_key is not None:
+            self._blog_semantic_cache.set(semantic_key, summary)
+        return summary
 
-            client = openai.OpenAI(api_key=self.api_key, base_url=base_url)
+    def summarize_blogs_batch(self, blogs: List[Dict], concurrency: int = 8) -> List[Optional[str]]:
+        """
+        并发为多篇博客生成摘要（每篇博客一次独立的 API 调用）
 
-            prompt = f"""请用中文解读这篇经典论文，100-150 字：
+        Args:
+            blogs: 博客列表
+            concurrency: 最大并发请求数
 
-**标题**: {paper['title']} ({paper.get('year', '')})
-**作者**: {paper['authors']}
-**简介**: {paper['description']}
-**关键词**: {', '.join(paper.get('keywords', []))}
+        Returns:
+            摘要列表，顺序与 blogs 一致，失败的位置为 None
+        """
+        if not blogs:
+            return []
 
-请回答：
-1. **历史地位**：这篇论文在 AI 发展史上的位置
-2. **核心贡献**：最关键的创新点
-3. **当今影响**：对今天的研究/工业界还有什么影响
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(blogs)))) as executor:
+            return list(executor.map(self.summarize_blog, blogs))
 
-简洁直接。"""
+    def summarize_classic_paper(self, paper: Dict) -> Optional[str]:
+        """为经典论文生成 AI 解读，聚焦历史意义"""
+        if not self.api_key:
+            return None
 
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "你是 AI 研究助手，擅长解读经典论文的历史意义和当代价值。"},
-                    {"role": "user", "content": prompt}
-                ],
+        try:
+            prompt = CLASSIC_PROMPT_TEMPLATE.format_map({
+                'title': paper['title'],
+                'year': paper.get('year', ''),
+                'authors': paper['authors'],
+                'description': paper['description'],
+                'keywords': ', '.join(paper.get('keywords', []))
+            })
+
+            summary = self._chat_openai(
+                CLASSIC_SYSTEM,
+                prompt,
                 max_tokens=400,
-                temperature=0.7
+                model=self._fast_model,
+                title=paper['title']
             )
-
-            summary = response.choices[0].message.content.strip()
-            print(f"  ✅ 经典论文解读生成成功，长度: {len(summary)} 字符")
+            logger.debug("  ✅ 经典论文解读生成成功，长度: %d 字符", len(summary))
             return f"🤖 **AI 解读**:\n\n{summary}"
 
         except Exception as e:
-            print(f"  ⚠️  经典论文解读失败: {e}")
+            logger.warning("  ⚠️  经典论文解读失败: %s", e)
             return None
 
+    def complete(self, system: str, prompt: str, max_tokens: int, temperature: float = 0.7) -> str:
+        """
+        通用的单轮对话调用（带缓存），供趋势总结等自定义提示词使用
+
+        配置了 OPENAI_BASE_URL 时无论 provider 都走中转的 OpenAI 兼容接口；未配置中转时 Claude 走原生接口
+        （系统提示词标记 cache_control 由服务端缓存），OpenAI 走官方接口，Gemini 没有可用的接口直接报错。
+        调用失败时直接抛出异常，由调用方处理。
+        """
+        if not self._use_relay:
+            if self.provider == 'claude':
+                return self._chat_claude(system, prompt, max_tokens, temperature)
+            if self.provider != 'openai':
+                raise ValueError(f"未配置 OPENAI_BASE_URL 时 {self.provider} 不支持通用调用")
+        return self._chat_openai(system, prompt, max_tokens, temperature)
+
     def _summarize_blog_with_claude(self, blog: Dict, content: str) -> Optional[str]:
         """使用 Claude 生成博客摘要"""
         try:
-            import anthropic
-            client = anthropic.Anthropic(api_key=self.api_key)
-
-            prompt = f"""请用中文简要总结这篇博客，控制在 150-200 字：
-
-**标题**: {blog['title']}
-**来源**: {blog['source']}
-
-**内容**:
-{content[:2000]}
-
-请回答：
-1. **核心观点**：文章主要说了什么（1-2 句）
-2. **关键发现**：最重要的信息或结论
-3. **值得关注**：对 AI 从业者的启发
-
-简洁直接。"""
-
-            response = client.messages.create(
-                model=self.model,
-                max_tokens=600,
-                temperature=0.7,
-                messages=[{"role": "user", "content": prompt}]
-            )
-
-            summary = response.content[0].text.strip()
-            print(f"  ✅ 博客摘要生成成功，长度: {len(summary)} 字符")
+            prompt = self._build_blog_input(blog, content)
+            summary = self._chat_claude(BLOG_SYSTEM, prompt, max_tokens=BLOG_MAX_TOKENS, title=blog['title'])
+            logger.debug("  ✅ 博客摘要生成成功，长度: %d 字符", len(summary))
             return summary
 
         except Exception as e:
-            print(f"  ⚠️  Claude 博客摘要失败: {e}")
+            logger.warning("  ⚠️  Claude 博客摘要失败: %s", e)
             return None
 
     def _summarize_blog_with_openai(self, blog: Dict, content: str) -> Optional[str]:
         """使用 OpenAI（兼容）生成博客摘要"""
         try:
-            import openai
-
-            base_url = os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1')
-            if not base_url.endswith('/v1'):
-                base_url = base_url.rstrip('/') + '/v1'
-
-            client = openai.OpenAI(api_key=self.api_key, base_url=base_url)
-
-            prompt = f"""请用中文简要总结这篇博客，控制在 150-200 字：
-
-**标题**: {blog['title']}
-**来源**: {blog['source']}
-
-**内容**:
-{content[:2000]}
-
-请回答：
-1. **核心观点**：文章主要说了什么（1-2 句）
-2. **关键发现**：最重要的信息或结论
-3. **值得关注**：对 AI 从业者的启发
-
-简洁直接。"""
-
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "你是一个 AI 研究助手，擅长总结和分析技术博客文章。"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=600,
-                temperature=0.7
-            )
-
-            summary = response.choices[0].message.content.strip()
-            print(f"  ✅ 博客摘要生成成功，长度: {len(summary)} 字符")
+            prompt = self._build_blog_input(blog, content)
+            summary = self._chat_openai(BLOG_SYSTEM, prompt, max_tokens=BLOG_MAX_TOKENS, title=blog['title'])
+            logger.debug("  ✅ 博客摘要生成成功，长度: %d 字符", len(summary))
             return summary
 
         except Exception as e:
-            print(f"  ⚠️  博客摘要 API 调用失败: {e}")
+            logger.warning("  ⚠️  博客摘要 API 调用失败: %s", e)
             return None
 
     def _summarize_with_claude(self, paper: Dict) -> Optional[str]:
         """使用 Claude 生成摘要"""
         try:
-            import anthropic
-
-            client = anthropic.Anthropic(api_key=self.api_key)
-            prompt = self._build_prompt(paper)
-
-            response = client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                temperature=0.7,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
-
-            summary = response.content[0].text
+            prompt = self._build_claude_paper_input(paper)
+            summary = self._chat_claude(CLAUDE_PAPER_SYSTEM, prompt, max_tokens=PAPER_MAX_TOKENS, title=paper['title'])
             return f"🤖 **Claude 解读**:\n\n{summary}"
 
         except ImportError:
-            print("⚠️  需要安装 anthropic 库: pip install anthropic")
+            logger.warning("⚠️  需要安装 anthropic 库: pip install anthropic")
             return None
         except Exception as e:
-            print(f"⚠️  Claude API 调用失败: {e}")
+            logger.warning("⚠️  Claude API 调用失败: %s", e)
             return None
 
     def _summarize_with_gemini(self, paper: Dict) -> Optional[str]:
@@ -276,7 +627,7 @@ class AISummarizer:
             response = model.generate_content(
                 prompt,
                 generation_config=genai.types.GenerationConfig(
-                    max_output_tokens=2000,
+                    max_output_tokens=PAPER_MAX_TOKENS,
                     temperature=0.7
                 )
             )
@@ -285,90 +636,352 @@ class AISummarizer:
             return f"🤖 **Gemini 解读**:\n\n{summary}"
 
         except ImportError:
-            print("⚠️  需要安装 google-generativeai 库: pip install google-generativeai")
+            logger.warning("⚠️  需要安装 google-generativeai 库: pip install google-generativeai")
             return None
         except Exception as e:
-            print(f"⚠️  Gemini API 调用失败: {e}")
+            logger.warning("⚠️  Gemini API 调用失败: %s", e)
             return None
 
     def _summarize_with_openai(self, paper: Dict, prev_context: str = None) -> Optional[str]:
         """使用 OpenAI（或兼容的中转 API）生成摘要"""
         try:
-            import openai
-
-            base_url = os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1')
-            if not base_url.endswith('/v1'):
-                base_url = base_url.rstrip('/') + '/v1'
-
-            client = openai.OpenAI(
-                api_key=self.api_key,
-                base_url=base_url
-            )
-
             prompt = self._build_prompt(paper, prev_context)
 
-            # 根据模型名称决定显示的标签
-            model_name = self.model
-            if 'claude' in model_name.lower():
-                ai_label = "Claude 解读"
-            elif 'gemini' in model_name.lower():
-                ai_label = "Gemini 解读"
-            elif 'gpt' in model_name.lower():
-                ai_label = "GPT 解读"
-            else:
-                ai_label = "AI 解读"
-
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "你是 AI 研究助手，用中文简洁解读学术论文，重点突出创新点和实际价值。"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=800,
-                temperature=0.7
+            summary = self._chat_openai(
+                PAPER_SYSTEM,
+                prompt,
+                max_tokens=OPENAI_PAPER_MAX_TOKENS,
+                title=paper['title']
             )
-
-            summary = response.choices[0].message.content.strip()
-            print(f"  ✅ 生成成功，长度: {len(summary)} 字符")
-            return f"🤖 **{ai_label}**:\n\n{summary}"
+            logger.debug("  ✅ 生成成功，长度: %d 字符", len(summary))
+            return f"🤖 **{self._ai_label}**:\n\n{summary}"
 
         except ImportError:
-            print("⚠️  需要安装 openai 库: pip install openai")
+            logger.warning("⚠️  需要安装 openai 库: pip install openai")
             return None
         except Exception as e:
-            print(f"⚠️  API 调用失败: {e}")
+            logger.warning("⚠️  API 调用失败: %s", e)
             return None
 
+    def _chat_openai(self, system: str, prompt: str, max_tokens: int, temperature: float = 0.7,
+                     model: Optional[str] = None, json_mode: bool = False,
+                     title: Optional[str] = None) -> str:
+        """
+        调用 OpenAI 兼容接口（带磁盘缓存），返回去除首尾空白的回复文本；model 为空时使用 self.model
+
+        json_mode 为 True 时请求 response_format=json_object，要求模型只输出 JSON 对象；
+        title 用于缓存 key 的归一化
+        """
+        model = model or self.model
+        cache_key = self._cache_key(system, prompt, max_tokens, temperature, model, title)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        client = self._get_openai_client()
+        extra = {'response_format': {"type": "json_object"}} if json_mode else {}
+        response = self._call_with_retry(
+            client.chat.completions.create,
+            model=model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **extra
+        )
+
+        choice = response.choices[0]
+        if choice.finish_reason == 'length':
+            logger.warning("  ⚠️  输出达到 max_tokens=%s 上限，内容可能被截断", max_tokens)
+        text = choice.message.content.strip()
+        self._cache_store(cache_key, text)
+        return text
+
+    def _chat_claude(self, system: str, prompt: str, max_tokens: int, temperature: float = 0.7,
+                     model: Optional[str] = None, title: Optional[str] = None) -> str:
+        """
+        调用 Claude 接口（带磁盘缓存），返回去除首尾空白的回复文本；model 为空时使用 self.model，title 用于缓存 key 的归一化
+
+        system 标记为 cache_control: ephemeral，批量调用时相同的系统提示词由服务端缓存，
+        只有论文/博客本身的内容按完整价格计费
+        """
+        model = model or self.model
+        cache_key = self._cache_key(system, prompt, max_tokens, temperature, model, title)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        client = self._get_anthropic_client()
+        response = self._call_with_retry(
+            client.messages.create,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=[{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+            messages=[{"role": "user", "content": prompt}]
+        )
+
+        if response.stop_reason == 'max_tokens':
+            logger.warning("  ⚠️  输出达到 max_tokens=%s 上限，内容可能被截断", max_tokens)
+        text = response.content[0].text.strip()
+        self._cache_store(cache_key, text)
+        return text
+
+    def _stream_openai(self, system: str, prompt: str, max_tokens: int, temperature: float = 0.7) -> Iterator[str]:
+        """流式调用 OpenAI 兼容接口（建立流式响应时的瞬时错误由 _call_with_retry 重试）"""
+        client = self._get_openai_client()
+        response = self._call_with_retry(
+            client.chat.completions.create,
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        )
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _stream_claude(self, system: str, prompt: str, max_tokens: int, temperature: float = 0.7) -> Iterator[str]:
+        """流式调用 Claude 接口（建立流式响应时的瞬时错误由 _call_with_retry 重试）"""
+        client = self._get_anthropic_client()
+        response = self._call_with_retry(
+            client.messages.create,
+            model=self.model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=[{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+            messages=[{"role": "user", "content": prompt}],
+            stream=True
+        )
+        with response:
+            for event in response:
+                if event.type == 'content_block_delta' and event.delta.type == 'text_delta':
+                    yield event.delta.text
+
+    @staticmethod
+    def _call_with_retry(func, **kwargs):
+        """调用 API，遇到瞬时错误时按指数退避（带随机抖动）重试，其他异常直接抛出"""
+        for attempt in range(1, MAX_API_ATTEMPTS + 1):
+            try:
+                return func(**kwargs)
+            except Exception as e:
+                retryable = isinstance(e, RETRY_ERRORS) or getattr(e, 'status_code', None) in RETRY_STATUS_CODES
+                if not retryable or attempt == MAX_API_ATTEMPTS:
+                    raise
+
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                delay += random.uniform(0, delay / 2)
+                logger.warning("  ↻ API 调用失败（%s），%.1f 秒后重试 (%d/%d)...",
+                               e, delay, attempt + 1, MAX_API_ATTEMPTS)
+                time.sleep(delay)
+
+    def _cache_key(self, system: Optional[str], prompt: str, max_tokens: int, temperature: float,
+                   model: Optional[str] = None, title: Optional[str] = None) -> str:
+        """
+        根据请求内容计算缓存 key：prompt 只归一化空白，容忍格式上的细微差异；
+        传入 title 时 prompt 中的标题按小写计入（摘要、代码等其余内容保持大小写敏感）
+        """
+        normalized = ' '.join(prompt.split())
+        if title:
+            title = ' '.join(title.split())
+            normalized = normalized.replace(title, title.lower())
+        raw = json.dumps({
+            'provider': self.provider,
+            'model': model or self.model,
+            'system': system,
+            'prompt': normalized,
+            'temperature': temperature,
+            'max_tokens': max_tokens
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _paper_cache_key(self, paper: Dict) -> Optional[str]:
+        """按论文 ID + 模型 + 提示词版本计算缓存 key，论文没有 ID 时返回 None"""
+        # hf_paper_fetcher 解析出的论文使用 paper_id 字段
+        paper_id = paper.get('paper_id') or paper.get('id')
+        if not paper_id:
+            return None
+        raw = f'paper:{self.provider}:{self.model}:v{PAPER_PROMPT_VERSION}:{paper_id}'
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _cache_lookup(self, key: str) -> Optional[str]:
+        """查询摘要缓存：先查进程内 LRU，再查磁盘（cache_ttl 为 0 时两层都禁用）"""
+        if self._cache is None:
+            return None
+        with self._memory_cache_lock:
+            if key in self._memory_cache:
+                self._memory_cache.move_to_end(key)
+                return self._memory_cache[key]
+
+        value = self._cache.get(key)
+        if value is not None:
+            self._remember(key, value)
+        return value
+
+    def _cache_store(self, key: str, value: str):
+        """写入摘要缓存（cache_ttl 为 0 时不写入）"""
+        if not value or self._cache is None:
+            return
+        self._remember(key, value)
+        self._cache.set(key, value)
+
+    def _remember(self, key: str, value: str):
+        """写入进程内 LRU，超出容量时淘汰最久未使用的条目"""
+        with self._memory_cache_lock:
+            self._memory_cache[key] = value
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+
+    def _warmup(self):
+        """
+        发送一个轻量请求，让连接池里预先有一条已建立的连接；失败直接忽略
+
+        与 complete 的路由一致：配置了中转时预热 OpenAI 兼容客户端（中转的 key 不能发给 Anthropic 原生接口）
+        """
+        try:
+            if self.provider == 'claude' and not self._use_relay:
+                self._get_anthropic_client().models.list(limit=1, timeout=3.0)
+            else:
+                self._get_openai_client().models.list(timeout=3.0)
+        except Exception:
+            pass
+
+    def _get_openai_client(self):
+        """获取 OpenAI 兼容客户端（模块级共享，见 get_openai_client）"""
+        return get_openai_client(self.api_key, self._base_url)
+
+    @staticmethod
+    def _normalize_base_url(base_url: str) -> str:
+        """补全 OpenAI 兼容接口的 /v1 后缀"""
+        if not base_url.endswith('/v1'):
+            base_url = base_url.rstrip('/') + '/v1'
+        return base_url
+
+    @staticmethod
+    def _compute_ai_label(model: str) -> str:
+        """根据模型名称决定显示的标签"""
+        model_name = model.lower()
+        if 'claude' in model_name:
+            return "Claude 解读"
+        elif 'gemini' in model_name:
+            return "Gemini 解读"
+        elif 'gpt' in model_name:
+            return "GPT 解读"
+        return "AI 解读"
+
+    def _get_anthropic_client(self):
+        """获取 Anthropic 客户端（模块级共享，见 _shared_anthropic_client）"""
+        if anthropic is None:
+            raise ImportError("anthropic")
+        with _CLIENT_LOCK:
+            return _shared_anthropic_client(self.api_key)
+
+    def _build_claude_paper_input(self, paper: Dict) -> str:
+        """构建 Claude 的用户消息（只包含论文本身，指令部分在系统提示词中）"""
+        return PAPER_INPUT_TEMPLATE.format_map({
+            'title': paper['title'],
+            'authors': paper.get('author_str', 'N/A'),
+            'summary': paper['summary']
+        })
+
+    def _build_blog_input(self, blog: Dict, content: str) -> str:
+        """构建博客摘要的用户消息（只包含博客本身，指令部分在系统提示词中）"""
+        return BLOG_INPUT_TEMPLATE.format_map({
+            'title': blog['title'],
+            'source': blog['source'],
+            'content': content
+        })
+
     def _build_prompt(self, paper: Dict, prev_context: str = None) -> str:
         """构建提示词"""
-        context_section = ""
-        if prev_context:
-            context_section = f"""
-**昨日推送摘要**（请参考，体现研究延续性）:
-{prev_context}
+        return PAPER_PROMPT_TEMPLATE.format_map({
+            'context_section': PAPER_CONTEXT_TEMPLATE.format_map({'prev_context': prev_context}) if prev_context else '',
+            'context_hint': '，以及与昨日推送内容的关联' if prev_context else '',
+            'title': paper['title'],
+            'authors': paper.get('author_str', 'N/A'),
+            'summary': paper['summary']
+        })
 
-"""
 
-        prompt = f"""请用中文简要解读以下论文，控制在 200-300 字：
-{context_section}
-**标题**: {paper['title']}
-**作者**: {paper.get('author_str', 'N/A')}
-**摘要**: {paper['summary']}
+# 客户端在模块级按 (api_key, base_url) 懒加载并复用：同一进程内的多个 AISummarizer 实例
+# （如机器人每次命令新建的实例）共享连接池，避免每次调用都重新建立连接池和 TLS 握手
+_CLIENT_LOCK = threading.Lock()
 
-请回答：
-1. **做了什么**：一句话概括核心工作
-2. **怎么做的**：关键方法（2-3 句）
-3. **效果如何**：主要结果
-4. **为什么重要**：对领域的意义{'，以及与昨日推送内容的关联' if prev_context else ''}
 
-简洁直接，不要客套话。"""
-        return prompt
+@lru_cache(maxsize=1)
+def _shared_http_client():
+    """
+    构建 OpenAI / Anthropic 客户端共用的 httpx 连接池（调用方需持有 _CLIENT_LOCK）
+
+    长 keep-alive 让连接在批量请求之间保持可用；安装了 h2 时启用 HTTP/2 多路复用。
+    httpx 不可用时返回 None，由 SDK 使用默认配置。
+    """
+    if httpx is None:
+        return None
+    return httpx.Client(
+        http2=importlib.util.find_spec('h2') is not None,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=180.0),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
+
+
+@lru_cache(maxsize=8)
+def _shared_openai_client(api_key: str, base_url: str):
+    """按 (api_key, base_url) 缓存 OpenAI 兼容客户端（调用方需持有 _CLIENT_LOCK）"""
+    # 重试由 _call_with_retry 统一处理，关闭 SDK 自带的重试避免次数叠加
+    return openai.OpenAI(api_key=api_key, base_url=base_url,
+                         http_client=_shared_http_client(), max_retries=0)
+
+
+def get_openai_client(api_key: str, base_url: Optional[str] = None):
+    """
+    获取模块级共享的 OpenAI 兼容客户端（SDK 自带重试已关闭，由调用方负责重试）
+
+    Args:
+        api_key: API 密钥
+        base_url: 接口地址，为空时读取 OPENAI_BASE_URL（自动补全 /v1 后缀）
+    """
+    if openai is None:
+        raise ImportError("openai")
+    base_url = AISummarizer._normalize_base_url(base_url or os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1'))
+    with _CLIENT_LOCK:
+        return _shared_openai_client(api_key, base_url)
+
+
+@lru_cache(maxsize=8)
+def _shared_anthropic_client(api_key: str):
+    """按 api_key 缓存 Anthropic 客户端（调用方需持有 _CLIENT_LOCK）"""
+    return anthropic.Anthropic(api_key=api_key, http_client=_shared_http_client(), max_retries=0)
+
+
+@lru_cache(maxsize=1)
+def _get_encoder():
+    """懒加载 tiktoken 编码器（首次加载需要读取/下载词表，只做一次）"""
+    return tiktoken.get_encoding('cl100k_base')
+
+
+def truncate_by_tokens(text: str, max_tokens: int) -> str:
+    """按 token 数截断文本；tiktoken 不可用时按 BLOG_INPUT_CHARS 字符截断"""
+    if tiktoken is None:
+        return text[:BLOG_INPUT_CHARS]
+
+    try:
+        enc = _get_encoder()
+    except Exception as e:
+        logger.warning("  ⚠️  加载 tiktoken 编码器失败，按字符截断: %s", e)
+        return text[:BLOG_INPUT_CHARS]
+
+    tokens = enc.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return enc.decode(tokens[:max_tokens])
 
 
 def get_summarizer_from_env():
@@ -381,12 +994,10 @@ def get_summarizer_from_env():
     # 获取模型名称
     model = os.getenv(f'{provider.upper()}_MODEL', None) or os.getenv('OPENAI_MODEL', None)
 
-    # 如果都没设置，使用默认值
-    if not model:
-        model = {
-            'claude': 'claude-sonnet-4-20250514',
-            'gemini': 'gemini-2.0-flash-exp',
-            'openai': 'gpt-4o'
-        }.get(provider, 'claude-sonnet-4-20250514')
+    # 都没设置时按速度档位选择默认模型
+    speed_tier = os.getenv('AI_SPEED_TIER', 'balanced')
+
+    enable_semantic_cache = os.getenv('AI_SEMANTIC_CACHE', 'false').lower() == 'true'
 
-    return AISummarizer(provider=provider, api_key=api_key, model=model)
+    return AISummarizer(provider=provider, api_key=api_key, model=model, speed_tier=speed_tier,
+                        enable_semantic_cache=enable_semantic_cache)
@@ -4,159 +4,296 @@
 获取 Anthropic、DeepMind、OpenAI 等实验室的最新博客
 """
 
-import feedparser
+import base64
+import heapq
+import html
+import io
+import json
+import re
+import threading
 import requests
+from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from disk_cache import DiskCache
+
+# RSS 解析器：安装了 feedparser-rs（Rust 实现，接口与 feedparser 兼容）时优先使用
+try:
+    import feedparser_rs
+except ImportError:
+    feedparser_rs = None
+
+# HTML 解析器：优先用 lxml（C 实现，比纯 Python 的 html.parser 快得多）
+try:
+    import lxml.etree
+    import lxml.html
+    HTML_PARSER = 'lxml'
+except ImportError:
+    lxml = None
+    HTML_PARSER = 'html.parser'
+
+# 并发抓取的线程数上限（所有源同时发起请求，总耗时约等于最慢的那个源）
+MAX_WORKERS = 32
+
+# 请求超时（秒）：(连接, 读取)，连不上的站点尽快放弃
+REQUEST_TIMEOUT = (5, 15)
+
+# 同一站点连续失败达到该次数后，本次运行不再请求该站点
+MAX_HOST_FAILURES = 3
+
+# 正文区域：只解析 <article> / <main> 子树，跳过导航、侧栏等无关节点
+MAIN_CONTENT_TAGS = ('article', 'main')
+MAIN_CONTENT_XPATH = '//article[not(ancestor::article or ancestor::main)] | //main[not(ancestor::article or ancestor::main)]'
+
+# 提取全文时丢弃的标签
+SKIP_TAGS = ('script', 'style', 'nav', 'footer', 'aside')
+
+# RSS 摘要清理：短片段直接用正则去标签，比构建 BeautifulSoup 解析树快得多
+TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# 全文抓取：总并发数，以及同一个站点的最大并发数（避免对单个站点压力过大）
+FULL_CONTENT_WORKERS = 16
+MAX_REQUESTS_PER_HOST = 4
+
+# 全文缓存有效期（秒）：一周内重复出现的文章不再重新下载和解析
+ARTICLE_CACHE_TTL = 7 * 86400
+
+# RSS 自带正文（content:encoded 等）清理后超过该长度时直接作为全文，不再请求原网页
+RSS_FULL_CONTENT_CHARS = 2000
+
+# 全文页面最多读取的字节数：只取前 500 行文本，超大页面（内嵌 base64 图片等）不必读完
+MAX_PAGE_BYTES = 512 * 1024
+
+
+# RSS 源配置（只保留有活跃 RSS 的源）
+# date_style（可选）：已知的日期格式，rfc2822（RSS 2.0 / WordPress / Ghost）或 iso（Atom），解析时优先尝试
+# 只读映射：模块级共享一份，运行期间不允许修改
+RSS_SOURCES = MappingProxyType({key: MappingProxyType(config) for key, config in {
+    # ============ Hacker News（AI 相关） ============
+    'hn_ai': {
+        'name': 'Hacker News (AI/ML)',
+        'rss_url': 'https://hnrss.org/frontpage?q=AI+OR+LLM+OR+machine+learning+OR+deep+learning+OR+GPT+OR+transformer',
+        'base_url': 'https://news.ycombinator.com',
+        'date_style': 'rfc2822'
+    },
+    'hn_best': {
+        'name': 'Hacker News (Best)',
+        'rss_url': 'https://hnrss.org/best',
+        'base_url': 'https://news.ycombinator.com',
+        'date_style': 'rfc2822'
+    },
+
+    # ============ 顶级个人研究者博客 ============
+    'karpathy': {
+        'name': 'Andrej Karpathy',
+        'rss_url': 'https://karpathy.github.io/feed.xml',
+        'base_url': 'https://karpathy.github.io'
+    },
+    'simon_willison': {
+        'name': 'Simon Willison (LLM 工具链)',
+        'rss_url': 'https://simonwillison.net/atom/everything/',
+        'base_url': 'https://simonwillison.net',
+        'date_style': 'iso'
+    },
+    'tim_dettmers': {
+        'name': 'Tim Dettmers (量化/高效训练)',
+        'rss_url': 'https://timdettmers.com/feed/',
+        'base_url': 'https://timdettmers.com',
+        'date_style': 'rfc2822'
+    },
+    'chip_huyen': {
+        'name': 'Chip Huyen (MLOps/数据)',
+        'rss_url': 'https://huyenchip.com/feed.xml',
+        'base_url': 'https://huyenchip.com'
+    },
+    'jay_alammar': {
+        'name': 'Jay Alammar (Transformer 可视化)',
+        'rss_url': 'https://jalammar.github.io/feed.xml',
+        'base_url': 'https://jalammar.github.io'
+    },
+    'colah': {
+        'name': 'Christopher Olah (Anthropic)',
+        'rss_url': 'https://colah.github.io/rss.xml',
+        'base_url': 'https://colah.github.io'
+    },
+
+    # ============ 高质量社区/期刊 ============
+    'lesswrong': {
+        'name': 'LessWrong (AI Alignment)',
+        'rss_url': 'https://www.lesswrong.com/feed.xml',
+        'base_url': 'https://www.lesswrong.com',
+        'date_style': 'rfc2822'
+    },
+    'the_gradient': {
+        'name': 'The Gradient (AI 深度分析)',
+        'rss_url': 'https://thegradient.pub/rss/',
+        'base_url': 'https://thegradient.pub',
+        'date_style': 'rfc2822'
+    },
+    'towards_data_science': {
+        'name': 'Towards Data Science',
+        'rss_url': 'https://towardsdatascience.com/feed',
+        'base_url': 'https://towardsdatascience.com',
+        'date_style': 'rfc2822'
+    },
+    'ml_mastery': {
+        'name': 'Machine Learning Mastery',
+        'rss_url': 'https://machinelearningmastery.com/feed/',
+        'base_url': 'https://machinelearningmastery.com',
+        'date_style': 'rfc2822'
+    },
+    'mit_tech_review': {
+        'name': 'MIT Technology Review',
+        'rss_url': 'https://www.technologyreview.com/feed/',
+        'base_url': 'https://www.technologyreview.com',
+        'date_style': 'rfc2822'
+    },
+
+    # ============ 顶级实验室/机构博客 ============
+    'openai': {
+        'name': 'OpenAI',
+        'rss_url': 'https://openai.com/blog/rss.xml',
+        'base_url': 'https://openai.com'
+    },
+    'anthropic': {
+        'name': 'Anthropic',
+        'rss_url': 'https://www.anthropic.com/rss',
+        'base_url': 'https://www.anthropic.com'
+    },
+    'deepmind': {
+        'name': 'DeepMind',
+        'rss_url': 'https://deepmind.google/discover/blog/feed/',
+        'base_url': 'https://deepmind.google'
+    },
+    'google_ai': {
+        'name': 'Google AI',
+        'rss_url': 'https://blog.google/technology/ai/rss/',
+        'base_url': 'https://blog.google'
+    },
+    'meta_ai': {
+        'name': 'Meta AI (FAIR)',
+        'rss_url': 'https://ai.meta.com/blog/rss/',
+        'base_url': 'https://ai.meta.com'
+    },
+    'microsoft_research': {
+        'name': 'Microsoft Research',
+        'rss_url': 'https://www.microsoft.com/en-us/research/blog/rss/',
+        'base_url': 'https://www.microsoft.com/en-us/research/blog/'
+    },
+    'nvidia': {
+        'name': 'NVIDIA AI Blog',
+        'rss_url': 'https://blogs.nvidia.com/feed/',
+        'base_url': 'https://blogs.nvidia.com',
+        'date_style': 'rfc2822'
+    },
+    'huggingface': {
+        'name': 'Hugging Face Blog',
+        'rss_url': 'https://huggingface.co/blog/feed.xml',
+        'base_url': 'https://huggingface.co/blog'
+    },
+    'bair': {
+        'name': 'BAIR (Berkeley AI Research)',
+        'rss_url': 'https://bair.berkeley.edu/blog/feed.xml',
+        'base_url': 'https://bair.berkeley.edu/blog'
+    },
+    'google_research': {
+        'name': 'Google Research Blog',
+        'rss_url': 'https://blog.research.google/feeds/posts/default',
+        'base_url': 'https://blog.research.google',
+        'date_style': 'iso'
+    },
+    'salesforce_ai': {
+        'name': 'Salesforce AI Research',
+        'rss_url': 'https://engineering.salesforce.com/rss/',
+        'base_url': 'https://engineering.salesforce.com',
+        'date_style': 'rfc2822'
+    },
+}.items()})
+
+
+# feedparser / bs4 依赖较多，按需导入：只查看 RSS_SOURCES 或构造 BlogFetcher 时不加载
+@lru_cache(maxsize=1)
+def _get_feedparser():
+    import feedparser
+    return feedparser
+
+
+@lru_cache(maxsize=1)
+def _get_bs4():
+    import bs4
+    return bs4
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """获取模块级共享的 requests.Session（懒加载，线程安全）"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers['User-Agent'] = 'Mozilla/5.0 (compatible; ai-paper-tracker/1.0; +feedparser)'
+            # 声明支持的压缩格式：安装了 brotli 时包含 br，否则只有 gzip/deflate（只声明能解码的格式）
+            session.headers['Accept-Encoding'] = ACCEPT_ENCODING.replace(',', ', ')
+
+            # 连接池大小与线程数一致，避免并发时连接被丢弃、反复握手；
+            # 限流和 5xx 等瞬时错误按指数退避自动重试（会参考 Retry-After 头）
+            retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                          allowed_methods=('GET', 'HEAD'))
+            adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, max_retries=retry)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
 
 
 class BlogFetcher:
     """博客文章抓取器"""
 
-    # RSS 源配置（只保留有活跃 RSS 的源）
-    RSS_SOURCES = {
-        # ============ Hacker News（AI 相关） ============
-        'hn_ai': {
-            'name': 'Hacker News (AI/ML)',
-            'rss_url': 'https://hnrss.org/frontpage?q=AI+OR+LLM+OR+machine+learning+OR+deep+learning+OR+GPT+OR+transformer',
-            'base_url': 'https://news.ycombinator.com'
-        },
-        'hn_best': {
-            'name': 'Hacker News (Best)',
-            'rss_url': 'https://hnrss.org/best',
-            'base_url': 'https://news.ycombinator.com'
-        },
-
-        # ============ 顶级个人研究者博客 ============
-        'karpathy': {
-            'name': 'Andrej Karpathy',
-            'rss_url': 'https://karpathy.github.io/feed.xml',
-            'base_url': 'https://karpathy.github.io'
-        },
-        'simon_willison': {
-            'name': 'Simon Willison (LLM 工具链)',
-            'rss_url': 'https://simonwillison.net/atom/everything/',
-            'base_url': 'https://simonwillison.net'
-        },
-        'tim_dettmers': {
-            'name': 'Tim Dettmers (量化/高效训练)',
-            'rss_url': 'https://timdettmers.com/feed/',
-            'base_url': 'https://timdettmers.com'
-        },
-        'chip_huyen': {
-            'name': 'Chip Huyen (MLOps/数据)',
-            'rss_url': 'https://huyenchip.com/feed.xml',
-            'base_url': 'https://huyenchip.com'
-        },
-        'jay_alammar': {
-            'name': 'Jay Alammar (Transformer 可视化)',
-            'rss_url': 'https://jalammar.github.io/feed.xml',
-            'base_url': 'https://jalammar.github.io'
-        },
-        'colah': {
-            'name': 'Christopher Olah (Anthropic)',
-            'rss_url': 'https://colah.github.io/rss.xml',
-            'base_url': 'https://colah.github.io'
-        },
-
-        # ============ 高质量社区/期刊 ============
-        'lesswrong': {
-            'name': 'LessWrong (AI Alignment)',
-            'rss_url': 'https://www.lesswrong.com/feed.xml',
-            'base_url': 'https://www.lesswrong.com'
-        },
-        'the_gradient': {
-            'name': 'The Gradient (AI 深度分析)',
-            'rss_url': 'https://thegradient.pub/rss/',
-            'base_url': 'https://thegradient.pub'
-        },
-        'towards_data_science': {
-            'name': 'Towards Data Science',
-            'rss_url': 'https://towardsdatascience.com/feed',
-            'base_url': 'https://towardsdatascience.com'
-        },
-        'ml_mastery': {
-            'name': 'Machine Learning Mastery',
-            'rss_url': 'https://machinelearningmastery.com/feed/',
-            'base_url': 'https://machinelearningmastery.com'
-        },
-        'mit_tech_review': {
-            'name': 'MIT Technology Review',
-            'rss_url': 'https://www.technologyreview.com/feed/',
-            'base_url': 'https://www.technologyreview.com'
-        },
-
-        # ============ 顶级实验室/机构博客 ============
-        'openai': {
-            'name': 'OpenAI',
-            'rss_url': 'https://openai.com/blog/rss.xml',
-            'base_url': 'https://openai.com'
-        },
-        'anthropic': {
-            'name': 'Anthropic',
-            'rss_url': 'https://www.anthropic.com/rss',
-            'base_url': 'https://www.anthropic.com'
-        },
-        'deepmind': {
-            'name': 'DeepMind',
-            'rss_url': 'https://deepmind.google/discover/blog/feed/',
-            'base_url': 'https://deepmind.google'
-        },
-        'google_ai': {
-            'name': 'Google AI',
-            'rss_url': 'https://blog.google/technology/ai/rss/',
-            'base_url': 'https://blog.google'
-        },
-        'meta_ai': {
-            'name': 'Meta AI (FAIR)',
-            'rss_url': 'https://ai.meta.com/blog/rss/',
-            'base_url': 'https://ai.meta.com'
-        },
-        'microsoft_research': {
-            'name': 'Microsoft Research',
-            'rss_url': 'https://www.microsoft.com/en-us/research/blog/rss/',
-            'base_url': 'https://www.microsoft.com/en-us/research/blog/'
-        },
-        'nvidia': {
-            'name': 'NVIDIA AI Blog',
-            'rss_url': 'https://blogs.nvidia.com/feed/',
-            'base_url': 'https://blogs.nvidia.com'
-        },
-        'huggingface': {
-            'name': 'Hugging Face Blog',
-            'rss_url': 'https://huggingface.co/blog/feed.xml',
-            'base_url': 'https://huggingface.co/blog'
-        },
-        'bair': {
-            'name': 'BAIR (Berkeley AI Research)',
-            'rss_url': 'https://bair.berkeley.edu/blog/feed.xml',
-            'base_url': 'https://bair.berkeley.edu/blog'
-        },
-        'google_research': {
-            'name': 'Google Research Blog',
-            'rss_url': 'https://blog.research.google/feeds/posts/default',
-            'base_url': 'https://blog.research.google'
-        },
-        'salesforce_ai': {
-            'name': 'Salesforce AI Research',
-            'rss_url': 'https://engineering.salesforce.com/rss/',
-            'base_url': 'https://engineering.salesforce.com'
-        },
-    }
-
-    def __init__(self, days_back: int = 7, max_articles: int = 5):
+    __slots__ = ('days_back', 'max_articles', 'full_content_workers', 'session',
+                 '_host_semaphores', '_host_failures', '_host_lock', '_feed_cache', '_article_cache')
+
+    # 兼容旧用法 BlogFetcher.RSS_SOURCES
+    RSS_SOURCES = RSS_SOURCES
+
+    def __init__(self, days_back: int = 7, max_articles: int = 5,
+                 full_content_workers: int = FULL_CONTENT_WORKERS):
         """
         初始化抓取器
 
         Args:
             days_back: 获取最近几天的文章
             max_articles: 每个源最多获取多少篇文章
+            full_content_workers: 并发抓取全文的线程数
         """
         self.days_back = days_back
         self.max_articles = max_articles
-        self.session = requests.Session()
+        self.full_content_workers = full_content_workers
+        # 所有 BlogFetcher 实例共享一个 session，多次抓取（如 paper_bot 的每条命令）复用已建立的连接
+        self.session = get_session()
+
+        # 每个站点一个信号量，限制对同一站点的并发请求数
+        self._host_semaphores = defaultdict(lambda: threading.Semaphore(MAX_REQUESTS_PER_HOST))
+        # 每个站点的连续失败次数（熔断：失败过多的站点直接跳过）
+        self._host_failures = Counter()
+        self._host_lock = threading.Lock()
+
+        # RSS 条件请求缓存：保存 ETag / Last-Modified 和上次的内容，源未更新时服务端返回 304
+        self._feed_cache = DiskCache('feeds')
+        self._article_cache = DiskCache('articles', ttl=ARTICLE_CACHE_TTL)
 
     def fetch_blogs(self, sources: List[str] = None, fetch_full_content: bool = True) -> List[Dict]:
         """
@@ -184,15 +321,12 @@ class BlogFetcher:
         def _fetch_source(args):
             source_key, source_config = args
             print(f"📰 获取 {source_config['name']} 博客...")
-            articles = self._fetch_from_rss(source_key, source_config, cutoff_date)
-            if fetch_full_content:
-                for article in articles:
-                    full_content = self._fetch_full_content(article)
-                    if full_content:
-                        article['full_content'] = full_content
-            return articles
+            return self._fetch_from_rss(source_key, source_config, cutoff_date)
+
+        if not valid_sources:
+            return []
 
-        with ThreadPoolExecutor(max_workers=8) as executor:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(valid_sources))) as executor:
             futures = {executor.submit(_fetch_source, src): src for src in valid_sources}
             for future in as_completed(futures):
                 try:
@@ -200,60 +334,144 @@ class BlogFetcher:
                 except Exception as e:
                     print(f"  ⚠️  源获取异常: {e}")
 
-        # 去重：按链接去重，避免同一篇文章重复出现
-        seen_links = set()
-        unique_articles = []
+        # 去重：按链接去重，避免同一篇文章重复出现（保留先出现的）
+        by_link = {}
         for article in all_articles:
             link = article.get('link', '')
-            if link and link not in seen_links:
-                seen_links.add(link)
-                unique_articles.append(article)
-
-        # 按时间排序（用 feedparser 解析日期，而非字符串比较）
-        def sort_key(x):
-            pub = x.get('published', '')
-            for fmt in ['%a, %d %b %Y %H:%M:%S %z', '%Y-%m-%dT%H:%M:%S%z',
-                         '%Y-%m-%dT%H:%M:%SZ', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d']:
-                try:
-                    return datetime.strptime(pub.strip(), fmt).replace(tzinfo=None)
-                except (ValueError, TypeError):
-                    continue
-            return datetime.min
+            if link:
+                by_link.setdefault(link, article)
+        unique_articles = list(by_link.values())
+
+        # 去重之后再并发抓取全文，重复文章不会被抓两次
+        if fetch_full_content:
+            self._fetch_full_contents_batch(unique_articles)
 
-        unique_articles.sort(key=sort_key, reverse=True)
+        # 按时间排序：直接使用解析 RSS 时已经算好的 pub_date，不再重复解析日期字符串
+        unique_articles.sort(key=lambda x: x['pub_date'], reverse=True)
+
+        # 移除内部字段
+        for article in unique_articles:
+            del article['pub_date']
+            del article['rss_content']
 
         print(f"✅ 获取到 {len(unique_articles)} 篇博客文章（去重前 {len(all_articles)} 篇）")
         return unique_articles
 
+    def _fetch_full_contents_batch(self, articles: List[Dict]):
+        """并发抓取多篇文章的全文，结果写回 article['full_content']"""
+        if not articles:
+            return
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.full_content_workers, len(articles)))) as executor:
+            future_to_article = {executor.submit(self._fetch_full_content, a): a for a in articles}
+            for future in as_completed(future_to_article):
+                full_content = future.result()
+                if full_content:
+                    future_to_article[future]['full_content'] = full_content
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        发起 GET 请求，带站点熔断：同一站点连续 MAX_HOST_FAILURES 次网络错误后直接跳过
+
+        重试由 session 上挂载的 Retry 处理，这里只统计重试耗尽后的失败
+        """
+        host = urlparse(url).netloc
+        with self._host_lock:
+            if self._host_failures[host] >= MAX_HOST_FAILURES:
+                raise requests.ConnectionError(f"{host} 连续失败 {MAX_HOST_FAILURES} 次，本次运行跳过")
+
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT, **kwargs)
+        except requests.RequestException:
+            with self._host_lock:
+                self._host_failures[host] += 1
+            raise
+
+        with self._host_lock:
+            self._host_failures.pop(host, None)
+        return response
+
+    def _host_semaphore(self, url: str) -> threading.Semaphore:
+        """获取 url 所属站点的并发信号量"""
+        with self._host_lock:
+            return self._host_semaphores[urlparse(url).netloc]
+
     def _fetch_full_content(self, article: Dict) -> Optional[str]:
         """获取博客文章的全文内容"""
         try:
+            # RSS 已经带了足够长的正文，省掉一次网页请求和解析
+            if article.get('rss_content'):
+                rss_text = self._extract_text(article['rss_content'])
+                if len(rss_text) > RSS_FULL_CONTENT_CHARS:
+                    return rss_text
+
             url = article['link']
-            response = self.session.get(url, timeout=30)
+            cached = self._article_cache.get(url)
+            if cached is not None:
+                return cached
+
+            with self._host_semaphore(url):
+                content = self._download_page(url)
+
+            # 优先只解析正文区域；页面没有 <article>/<main> 或内容过短时再解析整页
+            full_text = self._extract_text(content, main_only=True)
+            if len(full_text) <= 200:
+                full_text = self._extract_text(content)
+
+            if len(full_text) <= 200:
+                return None
+
+            self._article_cache.set(url, full_text)
+            return full_text
+
+        except Exception as e:
+            print(f"  ⚠️  获取全文失败: {e}")
+            return None
+
+    def _download_page(self, url: str) -> bytes:
+        """流式下载页面，读满 MAX_PAGE_BYTES 后提前停止"""
+        with self._get(url, stream=True) as response:
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            buf = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                buf.write(chunk)
+                if buf.tell() >= MAX_PAGE_BYTES:
+                    break
+            return buf.getvalue()
+
+    def _extract_text(self, content, main_only: bool = False) -> str:
+        """从 HTML 中提取正文文本（过滤短行，最多 500 行）；main_only 时只取 <article>/<main>"""
+        if lxml is not None:
+            texts = self._iter_text_lxml(content, main_only)
+        else:
+            bs4 = _get_bs4()
+            soup = bs4.BeautifulSoup(content, HTML_PARSER,
+                                     parse_only=bs4.SoupStrainer(list(MAIN_CONTENT_TAGS)) if main_only else None)
 
             # 移除不需要的标签
-            for script in soup(['script', 'style', 'nav', 'footer', 'aside']):
+            for script in soup(list(SKIP_TAGS)):
                 script.decompose()
+            texts = soup.stripped_strings
 
-            # 提取主要内容
-            content = soup.get_text(separator='\n', strip=True)
+        # 按行清理：去掉空行和过短的行（导航、按钮文字等），取前 500 行；惰性求值，凑够 500 行即停止
+        lines = (line.strip() for text in texts for line in text.split('\n'))
+        return '\n'.join(islice((line for line in lines if len(line) > 20), 500))
 
-            # 清理空白行
-            lines = [line.strip() for line in content.split('\n')]
-            lines = [line for line in lines if line and len(line) > 20]
-
-            full_text = '\n'.join(lines[:500])  # 取前 500 行
+    def _iter_text_lxml(self, content: bytes, main_only: bool) -> List[str]:
+        """用 lxml 在 C 层遍历文本节点（比 BeautifulSoup 的 get_text 快得多）"""
+        try:
+            root = lxml.html.fromstring(content)
+        except (lxml.etree.ParserError, ValueError):
+            return []
 
-            return full_text if len(full_text) > 200 else None
+        lxml.etree.strip_elements(root, *SKIP_TAGS, with_tail=False)
+        lxml.etree.strip_tags(root, lxml.etree.Comment)
 
-        except Exception as e:
-            print(f"  ⚠️  获取全文失败: {e}")
-            return None
+        roots = root.xpath(MAIN_CONTENT_XPATH) if main_only else [root]
+        return [text for node in roots for text in node.itertext()]
 
-    def _parse_entry_date(self, entry) -> Optional[datetime]:
+    def _parse_entry_date(self, entry, date_style: str = None) -> Optional[datetime]:
         """从 RSS entry 解析发布时间，优先使用 feedparser 已解析的 struct_time"""
         # feedparser 会自动解析日期到 published_parsed / updated_parsed
         parsed = entry.get('published_parsed') or entry.get('updated_parsed')
@@ -264,26 +482,57 @@ class BlogFetcher:
                 pass
 
         # 回退：手动解析原始日期字符串
-        published = entry.get('published', entry.get('updated', ''))
-        if not published:
-            return None
+        return parse_date_string(entry.get('published', entry.get('updated', '')), date_style)
+
+    def _fetch_feed(self, rss_url: str):
+        """
+        用共享 session 下载 RSS，再交给 feedparser 解析（复用连接池，不走 feedparser 内部的 urllib）
 
-        date_formats = [
-            '%a, %d %b %Y %H:%M:%S %z',
-            '%a, %d %b %Y %H:%M:%S %Z',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%dT%H:%M:%S.%f%z',
-            '%Y-%m-%dT%H:%M:%SZ',
-            '%Y-%m-%dT%H:%M:%S',
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d'
-        ]
-        for fmt in date_formats:
+        带上次的 ETag / Last-Modified 发条件请求，返回 304 时直接复用缓存的内容
+        """
+        cached = self._feed_cache.get(rss_url)
+        cached = json.loads(cached) if cached else None
+
+        request_headers = {}
+        if cached:
+            if cached.get('etag'):
+                request_headers['If-None-Match'] = cached['etag']
+            if cached.get('modified'):
+                request_headers['If-Modified-Since'] = cached['modified']
+
+        response = self._get(rss_url, headers=request_headers)
+
+        if response.status_code == 304 and cached:
+            print(f"  └─ 💾 RSS 未更新，使用缓存")
+            content = base64.b64decode(cached['body'])
+            headers = cached['headers']
+        else:
+            response.raise_for_status()
+            content = response.content
+
+            # feedparser 依赖小写的 content-type 等响应头判断编码
+            headers = {k.lower(): v for k, v in response.headers.items()}
+            headers.setdefault('content-location', response.url)
+
+            etag, modified = headers.get('etag'), headers.get('last-modified')
+            if etag or modified:
+                self._feed_cache.set(rss_url, json.dumps({
+                    'etag': etag,
+                    'modified': modified,
+                    'headers': {k: headers[k] for k in ('content-type', 'content-location') if k in headers},
+                    'body': base64.b64encode(content).decode('ascii')
+                }))
+
+        return self._parse_feed(content, headers)
+
+    def _parse_feed(self, content: bytes, headers: Dict):
+        """解析 RSS 内容；feedparser-rs 不可用或解析出错时回退到 feedparser"""
+        if feedparser_rs is not None:
             try:
-                return datetime.strptime(published.strip(), fmt)
-            except (ValueError, TypeError):
-                continue
-        return None
+                return feedparser_rs.parse(content)
+            except Exception as e:
+                print(f"  └─ ⚠️  feedparser-rs 解析失败，回退到 feedparser: {e}")
+        return _get_feedparser().parse(content, response_headers=headers)
 
     def _fetch_from_rss(self, source_key: str, source_config: Dict, cutoff_date: datetime) -> List[Dict]:
         """从 RSS 源获取文章"""
@@ -293,7 +542,8 @@ class BlogFetcher:
                 print(f"  └─ ⚠️  该源没有配置 RSS URL")
                 return []
 
-            feed = feedparser.parse(rss_url)
+            feed = self._fetch_feed(rss_url)
+            date_style = source_config.get('date_style')
 
             if feed.bozo and not feed.entries:
                 print(f"  └─ ❌ RSS 解析失败: {feed.bozo_exception}")
@@ -306,7 +556,7 @@ class BlogFetcher:
             # 先遍历所有条目，解析日期并过滤，再按时间排序取 top N
             candidates = []
             for entry in feed.entries:
-                pub_date = self._parse_entry_date(entry)
+                pub_date = self._parse_entry_date(entry, date_style)
                 published = entry.get('published', entry.get('updated', ''))
 
                 # 时间过滤：有日期的按日期过滤，无日期的跳过（避免混入旧文章）
@@ -319,10 +569,12 @@ class BlogFetcher:
                     continue
 
                 # 提取摘要
-                summary = entry.get('summary', entry.get('description', ''))
-                if summary:
-                    soup = BeautifulSoup(summary, 'html.parser')
-                    summary = soup.get_text()[:500]
+                raw_summary = entry.get('summary', entry.get('description', ''))
+                summary = strip_html(raw_summary)[:500] if raw_summary else raw_summary
+
+                # RSS 自带的正文（content:encoded / Atom content），没有时退回完整的 summary
+                contents = entry.get('content') or [{}]
+                rss_content = contents[0].get('value', '') or raw_summary
 
                 candidates.append({
                     'title': entry.get('title', ''),
@@ -331,16 +583,12 @@ class BlogFetcher:
                     'published': published,
                     'pub_date': pub_date_naive,
                     'source': source_config['name'],
-                    'source_key': source_key
+                    'source_key': source_key,
+                    'rss_content': rss_content
                 })
 
-            # 按日期倒序排序，取最新的 max_articles 篇
-            candidates.sort(key=lambda x: x['pub_date'], reverse=True)
-            articles = candidates[:self.max_articles]
-
-            # 移除内部排序字段
-            for a in articles:
-                del a['pub_date']
+            # 取最新的 max_articles 篇（部分排序；pub_date 留给 fetch_blogs 做全局排序）
+            articles = heapq.nlargest(self.max_articles, candidates, key=lambda x: x['pub_date'])
 
             print(f"  └─ {len(articles)} 篇（共 {len(candidates)} 篇在时间范围内）")
             return articles
@@ -350,6 +598,66 @@ class BlogFetcher:
             return []
 
 
+def strip_html(text: str) -> str:
+    """去掉 HTML 标签、解码实体并合并空白；含 <script>/<style> 时才用 BeautifulSoup 清理"""
+    lowered = text.lower()
+    if '<script' in lowered or '<style' in lowered:
+        soup = _get_bs4().BeautifulSoup(text, HTML_PARSER)
+        for tag in soup(['script', 'style']):
+            tag.decompose()
+        text = soup.get_text(' ')
+    else:
+        text = html.unescape(TAG_RE.sub(' ', text))
+    return WHITESPACE_RE.sub(' ', text).strip()
+
+
+def _parse_rfc2822(date_str: str) -> Optional[datetime]:
+    """解析 RFC 2822 日期（RSS 2.0）"""
+    try:
+        return parsedate_to_datetime(date_str)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _parse_iso(date_str: str) -> Optional[datetime]:
+    """解析 ISO 8601 日期（Atom）"""
+    # Python 3.11 之前的 fromisoformat 不认识结尾的 Z
+    if date_str.endswith('Z'):
+        date_str = date_str[:-1] + '+00:00'
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+
+# RSS_SOURCES 中 date_style 对应的解析函数
+DATE_PARSERS = {'rfc2822': _parse_rfc2822, 'iso': _parse_iso}
+
+
+def parse_date_string(date_str: str, date_style: str = None) -> Optional[datetime]:
+    """
+    解析 RSS / Atom 中的日期字符串，无法解析时返回 None
+
+    RFC 2822（RSS）用 parsedate_to_datetime，ISO 8601（Atom）用 fromisoformat，
+    都是单次调用，不需要逐个尝试 strptime 格式。已知源的日期格式（date_style）时
+    只尝试对应的解析函数，解析失败再按通用顺序尝试
+    """
+    if not date_str:
+        return None
+    date_str = date_str.strip()
+
+    parsers = (_parse_rfc2822, _parse_iso)
+    if date_style in DATE_PARSERS:
+        hinted = DATE_PARSERS[date_style]
+        parsers = (hinted,) + tuple(p for p in parsers if p is not hinted)
+
+    for parser in parsers:
+        parsed = parser(date_str)
+        if parsed is not None:
+            return parsed
+    return None
+
+
 # 测试代码
 if __name__ == "__main__":
     fetcher = BlogFetcher(days_back=7, max_articles=3)
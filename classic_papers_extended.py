@@ -4,8 +4,17 @@
 精选 AI 领域的经典论文，包含领域关键词解析
 """
 
-from typing import List, Dict, Optional
+import random
+import re
+from functools import lru_cache
+from itertools import chain, islice
+from typing import Dict, Iterator, List, Optional, Tuple
 
+# 多模式匹配：安装了 pyahocorasick 时用 Aho-Corasick 自动机一次扫描匹配全部关键词
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # 经典论文列表（大幅扩展）
 CLASSIC_PAPERS = {
@@ -334,6 +343,138 @@ CLASSIC_PAPERS = {
 }
 
 
+# 导入时展开一次：每篇论文预先带上 category / source / is_classic 字段，查询时不再重复构造
+# 这些字典在多次调用间共享，调用方只读；需要修改时先 dict() 复制
+_FLAT_BY_CATEGORY = {
+    category: [
+        {**paper, 'category': category, 'source': 'classic', 'is_classic': True}
+        for paper in papers
+    ]
+    for category, papers in CLASSIC_PAPERS.items()
+}
+_FLAT_PAPERS = list(chain.from_iterable(_FLAT_BY_CATEGORY.values()))
+# 关键词搜索的返回格式不含 is_classic 字段，同样预先构造好、在多次调用间共享
+_FLAT_SEARCH_RESULTS = [
+    {key: value for key, value in paper.items() if key != 'is_classic'}
+    for paper in _FLAT_PAPERS
+]
+
+# 关键词搜索索引：每篇论文的小写检索文本（标题、简介、各关键词之间用 \x00 分隔，避免跨字段匹配），
+# 以及英文/数字 token -> 论文下标的倒排索引
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_PAPER_LOWER_BLOB = [
+    '\x00'.join([paper['title'], paper['description'], *paper.get('keywords', ())]).lower()
+    for paper in _FLAT_PAPERS
+]
+_TOKEN_INDEX: Dict[str, List[int]] = {}
+for _i, _blob in enumerate(_PAPER_LOWER_BLOB):
+    for _token in set(_TOKEN_RE.findall(_blob)):
+        _TOKEN_INDEX.setdefault(_token, []).append(_i)
+del _i, _blob, _token
+
+# 关键词反查：小写关键词 -> [(论文下标, 原始关键词), ...]，供 match_all_keywords 使用
+_KEYWORD_OWNERS: Dict[str, List[Tuple[int, str]]] = {}
+for _i, _paper in enumerate(_FLAT_PAPERS):
+    for _kw in _paper.get('keywords', ()):
+        _KEYWORD_OWNERS.setdefault(_kw.lower(), []).append((_i, _kw))
+del _i, _paper, _kw
+
+# 批量查询中至少有这么多条需要子串匹配的关键词时，才值得临时构建自动机
+AHOCORASICK_MIN_QUERIES = 8
+
+
+def _build_automaton(patterns: Dict[str, object]):
+    """用 模式 -> 值 构建 Aho-Corasick 自动机（空模式需由调用方单独处理）"""
+    automaton = ahocorasick.Automaton()
+    for pattern, value in patterns.items():
+        automaton.add_word(pattern, value)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_automaton({kw_lc: kw_lc for kw_lc in _KEYWORD_OWNERS}) if ahocorasick else None
+
+# 类别之间的交叉参考（部分相关领域如 agents / reasoning 不在 CLASSIC_PAPERS 中，仅作展示）
+_CATEGORY_RELATIONS: Dict[str, Tuple[str, ...]] = {
+    'reinforcement_learning': ('llm', 'agents', 'alignment'),
+    'alignment': ('llm', 'reinforcement_learning'),
+    'ai4math': ('llm', 'reasoning'),
+    'formal_verification': ('ai4math', 'reasoning'),
+    'llm': ('alignment', 'reasoning', 'scaling_laws'),
+    'data_engineering': ('scaling_laws', 'llm', 'multimodal'),
+    'multimodal': ('data_engineering', 'llm', 'scaling_laws'),
+    'scaling_laws': ('llm', 'data_engineering'),
+}
+
+
+def _match_keywords(keywords_lc: List[str]) -> Dict[str, Tuple[int, ...]]:
+    """在检索索引中匹配（已小写的）关键词，返回 关键词 -> 命中论文下标（升序）"""
+    matches: Dict[str, set] = {kw_lc: set() for kw_lc in keywords_lc}
+    token_queries = [kw_lc for kw_lc in matches if _TOKEN_RE.fullmatch(kw_lc)]
+    blob_queries = [kw_lc for kw_lc in matches if not _TOKEN_RE.fullmatch(kw_lc)]
+
+    if token_queries:
+        # 纯英文/数字的查询只可能出现在某个 token 内部：只需扫描词表，再取倒排列表
+        for token, postings in _TOKEN_INDEX.items():
+            for kw_lc in token_queries:
+                if kw_lc in token:
+                    matches[kw_lc].update(postings)
+
+    if '' in blob_queries:
+        # 空查询是任何文本的子串
+        matches[''].update(range(len(_PAPER_LOWER_BLOB)))
+        blob_queries.remove('')
+
+    if ahocorasick and len(blob_queries) >= AHOCORASICK_MIN_QUERIES:
+        # 查询较多时：所有模式放进一个自动机，每篇论文的检索文本只扫描一遍
+        automaton = _build_automaton({kw_lc: kw_lc for kw_lc in blob_queries})
+        for i, blob in enumerate(_PAPER_LOWER_BLOB):
+            for _, kw_lc in automaton.iter(blob):
+                matches[kw_lc].add(i)
+    elif blob_queries:
+        # 含中文、空格或符号的查询：在预先小写化的检索文本中做子串匹配
+        for i, blob in enumerate(_PAPER_LOWER_BLOB):
+            for kw_lc in blob_queries:
+                if kw_lc in blob:
+                    matches[kw_lc].add(i)
+
+    return {kw_lc: tuple(sorted(ids)) for kw_lc, ids in matches.items()}
+
+
+@lru_cache(maxsize=256)
+def _search_classic_papers(keyword_lc: str) -> Tuple[int, ...]:
+    """单个关键词的搜索结果（论文下标），CLASSIC_PAPERS 是常量，缓存无需失效"""
+    return _match_keywords([keyword_lc])[keyword_lc]
+
+
+def match_all_keywords(text: str) -> Dict[int, List[str]]:
+    """
+    找出文本中出现的所有经典论文关键词（如把新论文摘要与经典论文做交叉关联）
+
+    Args:
+        text: 待匹配文本（大小写不敏感）
+
+    Returns:
+        论文在 get_papers() 全量列表中的下标 -> 该论文在文本中出现的关键词
+    """
+    text_lc = text.lower()
+    if _KEYWORD_AUTOMATON is not None:
+        found = {kw_lc for _, kw_lc in _KEYWORD_AUTOMATON.iter(text_lc)}
+    else:
+        found = {kw_lc for kw_lc in _KEYWORD_OWNERS if kw_lc in text_lc}
+
+    result: Dict[int, List[str]] = {}
+    for kw_lc in found:
+        for i, kw in _KEYWORD_OWNERS[kw_lc]:
+            result.setdefault(i, []).append(kw)
+
+    # 关键词按论文原有顺序排列，结果与集合遍历顺序无关
+    return {
+        i: [kw for kw in _FLAT_PAPERS[i]['keywords'] if kw in kws]
+        for i, kws in sorted(result.items())
+    }
+
+
 class ClassicPaperFetcher:
     """经典论文获取器"""
 
@@ -346,101 +487,90 @@ class ClassicPaperFetcher:
         """
         self.categories = categories or list(CLASSIC_PAPERS.keys())
 
-    def get_papers(self, limit: int = None) -> List[Dict]:
-        """获取经典论文列表"""
-        papers = []
-
-        for category in self.categories:
-            if category in CLASSIC_PAPERS:
-                for paper in CLASSIC_PAPERS[category]:
-                    papers.append({
-                        **paper,
-                        'category': category,
-                        'source': 'classic',
-                        'is_classic': True
-                    })
+    def iter_papers(self) -> Iterator[Dict]:
+        """按类别顺序逐篇产出经典论文（共享的论文字典，只读）"""
+        return chain.from_iterable(
+            _FLAT_BY_CATEGORY[category] for category in self.categories if category in _FLAT_BY_CATEGORY
+        )
 
+    def get_papers(self, limit: int = None) -> List[Dict]:
+        """获取经典论文列表（列表是新的，论文字典在多次调用间共享、只读，需要修改时先 dict() 复制）"""
         if limit:
-            papers = papers[:limit]
-
-        return papers
+            return list(islice(self.iter_papers(), limit))
+        return list(self.iter_papers())
 
     def get_random_paper(self) -> Dict:
-        """获取一篇随机经典论文"""
-        import random
-        all_papers = self.get_papers()
-        return random.choice(all_papers) if all_papers else None
+        """获取一篇随机经典论文（返回副本，调用方可以直接添加字段）"""
+        if self.categories == list(CLASSIC_PAPERS):
+            pool = _FLAT_PAPERS
+        else:
+            pool = list(self.iter_papers())
+        return dict(random.choice(pool)) if pool else None
 
     def get_papers_by_keyword(self, keyword: str) -> List[Dict]:
-        """根据关键词搜索相关论文"""
-        keyword = keyword.lower()
-        results = []
-
-        for category, papers in CLASSIC_PAPERS.items():
-            for paper in papers:
-                # 搜索标题、描述和关键词
-                if (keyword in paper['title'].lower() or
-                    keyword in paper['description'].lower() or
-                    any(keyword in kw.lower() for kw in paper.get('keywords', []))):
-                    results.append({
-                        **paper,
-                        'category': category,
-                        'source': 'classic'
-                    })
-
-        return results
-
-    def format_keywords_analysis(self, paper: Dict) -> str:
-        """格式化领域关键词解析"""
+        """根据关键词搜索相关论文（在标题、描述和关键词中做子串匹配，返回共享的只读论文字典）"""
+        return [_FLAT_SEARCH_RESULTS[i] for i in _search_classic_papers(keyword.lower())]
+
+    def get_papers_by_keywords(self, keywords: List[str]) -> Dict[str, List[Dict]]:
+        """
+        批量关键词搜索：词表和检索文本各只遍历一次
+
+        Args:
+            keywords: 关键词列表（大小写不敏感，子串匹配）
+
+        Returns:
+            关键词 -> 匹配的论文列表（按目录顺序，论文字典共享、只读）
+        """
+        lowered = {kw: kw.lower() for kw in keywords}
+        matches = _match_keywords(list(lowered.values()))
+        return {
+            kw: [_FLAT_SEARCH_RESULTS[i] for i in matches[kw_lc]]
+            for kw, kw_lc in lowered.items()
+        }
+
+    @staticmethod
+    def format_keywords_analysis(paper: Dict) -> str:
+        """格式化领域关键词解析（结果只取决于类别和关键词，按这两项缓存）"""
         keywords = paper.get('keywords', [])
         if not keywords:
             return ""
 
-        analysis = f"\n🔑 **领域关键词解析**:\n"
-        analysis += f"这篇论文属于 **{paper['category']}** 领域，核心概念包括：\n\n"
-        analysis += "```"
-        for kw in keywords:
-            analysis += f"• {kw}\n"
-        analysis += "```\n\n"
+        return ClassicPaperFetcher._format_keywords_analysis(paper['category'], tuple(keywords))
+
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _format_keywords_analysis(cls, category: str, keywords: tuple) -> str:
+        """生成关键词解析文本"""
+        kw_lines = ''.join(f"• {kw}\n" for kw in keywords)
 
         # 添加相关领域的交叉参考
-        related = self._find_related_categories(paper['category'], keywords)
-        if related:
-            analysis += f"🔗 **相关领域**: {', '.join(related)}\n\n"
+        related = cls._find_related_categories(category, list(keywords))
+        related_line = f"🔗 **相关领域**: {', '.join(related)}\n\n" if related else ""
 
-        return analysis
+        return (
+            f"\n🔑 **领域关键词解析**:\n"
+            f"这篇论文属于 **{category}** 领域，核心概念包括：\n\n"
+            f"```{kw_lines}```\n\n"
+            f"{related_line}"
+        )
 
-    def _find_related_categories(self, current_category: str, keywords: List[str]) -> List[str]:
+    @staticmethod
+    def _find_related_categories(current_category: str, keywords: List[str]) -> List[str]:
         """找出相关的其他类别"""
-        category_relations = {
-            'reinforcement_learning': ['llm', 'agents', 'alignment'],
-            'alignment': ['llm', 'reinforcement_learning'],
-            'ai4math': ['llm', 'reasoning'],
-            'formal_verification': ['ai4math', 'reasoning'],
-            'llm': ['alignment', 'reasoning', 'scaling_laws'],
-            'data_engineering': ['scaling_laws', 'llm', 'multimodal'],
-            'multimodal': ['data_engineering', 'llm', 'scaling_laws'],
-            'scaling_laws': ['llm', 'data_engineering']
-        }
-
-        return category_relations.get(current_category, [])
+        return list(_CATEGORY_RELATIONS.get(current_category, ()))
 
 
 def format_classic_paper_card(paper: Dict) -> Dict:
     """格式化为飞书卡片元素"""
-    fetcher = ClassicPaperFetcher()
-
-    title = f"📖 {paper['title']}"
-    if paper.get('year'):
-        title += f" ({paper['year']})"
-
-    content = f"**{paper['title']}** ({paper.get('year', 'N/A')})\n\n"
-    content += f"👥 **作者**: {paper['authors']}\n\n"
-    content += f"📝 **简介**: {paper['description']}\n\n"
-
     # 添加关键词解析
-    keywords_analysis = fetcher.format_keywords_analysis(paper)
-    content += keywords_analysis
+    keywords_analysis = ClassicPaperFetcher.format_keywords_analysis(paper)
+
+    content = (
+        f"**{paper['title']}** ({paper.get('year', 'N/A')})\n\n"
+        f"👥 **作者**: {paper['authors']}\n\n"
+        f"📝 **简介**: {paper['description']}\n\n"
+        f"{keywords_analysis}"
+    )
 
     return {
         "tag": "div",
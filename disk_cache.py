@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+💾 本地磁盘缓存
+- DiskCache: 基于 sqlite3 的简单 KV 缓存（带过期时间），用于跨运行复用 AI 摘要等结果
+- SemanticCache: 基于向量相似度的缓存，内容几乎相同（如论文 v1 -> v2）时复用结果
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 缓存目录，可通过环境变量覆盖
+CACHE_DIR = os.path.expanduser(os.getenv('AI_PAPER_CACHE_DIR', '~/.cache/ai-paper-tracker'))
+
+
+class DiskCache:
+    """sqlite3 实现的 KV 缓存，任何读写异常都只记录警告，不影响主流程"""
+
+    def __init__(self, name: str, ttl: Optional[float] = None):
+        """
+        初始化缓存
+
+        Args:
+            name: 缓存名称，对应 CACHE_DIR 下的 <name>.db 文件
+            ttl: 过期时间（秒），None 表示永不过期
+        """
+        self.path = os.path.join(CACHE_DIR, f'{name}.db')
+        self.ttl = ttl
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """懒加载数据库连接（多线程共享，由 self._lock 串行化访问），打开时清理已过期的条目"""
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS cache ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)'
+            )
+            # 过期条目读取时会被跳过，但不删除的话数据库文件会随每日运行无限增长
+            if self.ttl:
+                conn.execute('DELETE FROM cache WHERE created_at < ?', (time.time() - self.ttl,))
+                conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """读取缓存，未命中或已过期返回 None"""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    'SELECT value, created_at FROM cache WHERE key = ?', (key,)
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("  ⚠️  读取缓存失败: %s", e)
+            return None
+
+        if row is None:
+            return None
+
+        value, created_at = row
+        if self.ttl and time.time() - created_at > self.ttl:
+            return None
+        return value
+
+    def set(self, key: str, value: str):
+        """写入缓存（覆盖旧值）"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    'INSERT OR REPLACE INTO cache (key, value, created_at) VALUES (?, ?, ?)',
+                    (key, value, time.time())
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("  ⚠️  写入缓存失败: %s", e)
+
+
+class SemanticCache:
+    """
+    语义缓存：用 sentence-transformers 计算文本向量，FAISS 内积检索最相近的历史条目
+
+    依赖（sentence-transformers、faiss、numpy）和模型都在第一次使用时加载（模型约 200MB），
+    缺少依赖时自动禁用，lookup 始终返回 None
+    """
+
+    MODEL_NAME = 'paraphrase-multilingual-MiniLM-L12-v2'
+
+    def __init__(self, name: str, threshold: float = 0.95):
+        """
+        初始化语义缓存
+
+        Args:
+            name: 缓存名称，对应 CACHE_DIR 下的 <name>.faiss / <name>.json 文件
+            threshold: 余弦相似度阈值，不低于该值视为命中
+        """
+        self.index_path = os.path.join(CACHE_DIR, f'{name}.faiss')
+        self.values_path = os.path.join(CACHE_DIR, f'{name}.json')
+        self.threshold = threshold
+        self._model = None
+        self._index = None
+        self._values: List[str] = []
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> bool:
+        """懒加载模型和索引（调用方需持有 self._lock），不可用时返回 False"""
+        if self._disabled:
+            return False
+        if self._model is not None:
+            return True
+
+        try:
+            import faiss
+            from sentence_transformers import SentenceTransformer
+
+            model = SentenceTransformer(self.MODEL_NAME)
+            if os.path.exists(self.index_path) and os.path.exists(self.values_path):
+                index = faiss.read_index(self.index_path)
+                with open(self.values_path, 'r', encoding='utf-8') as f:
+                    values = json.load(f)
+            else:
+                index = faiss.IndexFlatIP(model.get_sentence_embedding_dimension())
+                values = []
+        except Exception as e:
+            logger.warning("  ⚠️  语义缓存不可用，已禁用: %s", e)
+            self._disabled = True
+            return False
+
+        if index.ntotal != len(values):
+            logger.warning("  ⚠️  语义缓存索引与数据不一致，重新建立")
+            index.reset()
+            values = []
+
+        self._model, self._index, self._values = model, index, values
+        return True
+
+    def _encode(self, text: str):
+        """计算归一化的文本向量（内积即余弦相似度）"""
+        return self._model.encode([text], normalize_embeddings=True).astype('float32')
+
+    def get(self, text: str) -> Optional[str]:
+        """查找与 text 足够相似的历史条目，未命中返回 None"""
+        with self._lock:
+            if not self._load() or self._index.ntotal == 0:
+                return None
+            scores, ids = self._index.search(self._encode(text), 1)
+
+            if scores[0][0] >= self.threshold:
+                return self._values[ids[0][0]]
+            return None
+
+    def set(self, text: str, value: str):
+        """添加条目并写回磁盘"""
+        with self._lock:
+            if not self._load():
+                return
+            self._index.add(self._encode(text))
+            self._values.append(value)
+
+            try:
+                import faiss
+
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                faiss.write_index(self._index, self.index_path)
+                tmp_path = self.values_path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._values, f, ensure_ascii=False)
+                os.replace(tmp_path, self.values_path)
+            except (OSError, RuntimeError) as e:
+                logger.warning("  ⚠️  写入语义缓存失败: %s", e)
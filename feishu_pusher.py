@@ -6,7 +6,89 @@
 
 import requests
 import json
-from typing import List, Dict, Optional
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Iterator, List, Dict, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# JSON 编解码：安装了 orjson（Rust 实现）时优先使用，否则退回标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Webhook 连接池大小，也是多群并发推送的最大线程数
+POOL_SIZE = 4
+
+# 论文卡片 / 富文本中摘要预览的最大字符数
+SUMMARY_PREVIEW_CHARS = 150
+
+JSON_HEADERS = {'Content-Type': 'application/json; charset=utf-8'}
+
+# 卡片中固定不变的部分，各卡片共享同一对象（只读，不要修改；
+# 序列化需要普通 dict，所以没有用 MappingProxyType）
+HR_ELEMENT = {"tag": "hr"}
+CARD_CONFIG = {"wide_screen_mode": True}
+PAPERS_CARD_HEADER = {
+    "title": {
+        "tag": "plain_text",
+        "content": "🤖 Hugging Face Daily Papers"
+    },
+    "template": "blue"
+}
+VIEW_PAPER_BUTTON_TEXT = {"tag": "plain_text", "content": "查看论文"}
+PDF_BUTTON_TEXT = {"tag": "plain_text", "content": "下载 PDF"}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """获取模块级共享的 requests.Session（懒加载，线程安全），多个推送器复用同一连接池"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            # 只自动重试连接失败（请求尚未发出，不会重复推送）；
+            # 业务层面的失败和超时由 _send 中的重试循环处理
+            retry = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3)
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+
+def _truncate(text: str, limit: int) -> str:
+    """超过 limit 个字符时截断并加省略号"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+
+def _md_div(content: str) -> Dict:
+    """构建 lark_md 文本块元素"""
+    return {"tag": "div", "text": {"tag": "lark_md", "content": content}}
+
+
+def _dumps(payload: Dict) -> bytes:
+    """把 payload 序列化为 UTF-8 JSON 字节串"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+def _loads(content: bytes):
+    """解析 JSON 响应体"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 class FeishuBotPusher:
@@ -24,7 +106,7 @@ class FeishuBotPusher:
         self.webhook_urls = webhook_urls or []
         if webhook_url:
             self.webhook_urls.append(webhook_url)
-        self.session = requests.Session()
+        self.session = get_session()
 
     def send_text(self, content: str) -> bool:
         """
@@ -54,19 +136,7 @@ class FeishuBotPusher:
         Returns:
             是否发送成功
         """
-        payload = {
-            "msg_type": "post",
-            "content": {
-                "post": {
-                    "zh_cn": {
-                        "title": title,
-                        "content": content
-                    }
-                }
-            }
-        }
-
-        return self._send(payload)
+        return self._send(self._post_payload(title, content))
 
     def send_interactive_card(self, card: Dict) -> bool:
         """
@@ -78,13 +148,31 @@ class FeishuBotPusher:
         Returns:
             是否发送成功
         """
-        payload = {
+        return self._send(self._card_payload(card))
+
+    @staticmethod
+    def _post_payload(title: str, content: List[Dict[str, str]]) -> Dict:
+        """构建富文本消息 payload"""
+        return {
+            "msg_type": "post",
+            "content": {
+                "post": {
+                    "zh_cn": {
+                        "title": title,
+                        "content": content
+                    }
+                }
+            }
+        }
+
+    @staticmethod
+    def _card_payload(card: Dict) -> Dict:
+        """构建交互式卡片消息 payload"""
+        return {
             "msg_type": "interactive",
             "card": card
         }
 
-        return self._send(payload)
-
     def format_papers_card(self, papers: List[Dict]) -> Dict:
         """
         格式化论文列表为飞书卡片
@@ -95,115 +183,83 @@ class FeishuBotPusher:
         Returns:
             飞书卡片字典
         """
-        from datetime import datetime
-
-        # 构建卡片元素
-        elements = []
+        # 统计信息（本地时间，time.strftime 无需构造 datetime 对象）
+        timestamp = time.strftime('%Y-%m-%d %H:%M')
+        stats = _md_div(f"**📊 共 {len(papers)} 篇论文**\n**⏰ {timestamp}**")
 
-        # 添加统计信息
-        elements.append({
-            "tag": "div",
-            "text": {
-                "tag": "lark_md",
-                "content": f"**📊 共 {len(papers)} 篇论文**\n**⏰ {datetime.now().strftime('%Y-%m-%d %H:%M')}**"
-            }
-        })
-
-        elements.append({"tag": "hr"})
-
-        # 添加每篇论文
-        for i, paper in enumerate(papers, 1):
-            # 论文标题
-            elements.append({
-                "tag": "div",
-                "text": {
-                    "tag": "lark_md",
-                    "content": f"**{i}. {paper['title']}**"
-                }
-            })
-
-            # 作者
-            if paper.get('author_str'):
-                elements.append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": f"👥 {paper['author_str']}"
-                    }
-                })
-
-            # 发布时间
-            if paper.get('published'):
-                elements.append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": f"📅 {paper['published']}"
-                    }
-                })
-
-            # 摘要（截断）
-            summary = paper.get('summary', '')
-            if summary:
-                summary_preview = summary[:150] + '...' if len(summary) > 150 else summary
-                elements.append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": f"📝 {summary_preview}"
-                    }
-                })
-
-            # 按钮链接
-            actions = []
-            if paper.get('paper_url'):
-                actions.append({
-                    "tag": "button",
-                    "text": {
-                        "tag": "plain_text",
-                        "content": "查看论文"
-                    },
-                    "type": "default",
-                    "url": paper['paper_url']
-                })
-            if paper.get('pdf_url'):
-                actions.append({
-                    "tag": "button",
-                    "text": {
-                        "tag": "plain_text",
-                        "content": "下载 PDF"
-                    },
-                    "type": "primary",
-                    "url": paper['pdf_url']
-                })
-
-            if actions:
-                elements.append({
-                    "tag": "action",
-                    "actions": actions
-                })
-
-            # 分隔线（除了最后一篇）
-            if i < len(papers):
-                elements.append({"tag": "hr"})
+        # 构建卡片元素：统计信息 + 分隔线 + 每篇论文的元素
+        elements = list(chain(
+            (stats, HR_ELEMENT),
+            *(self._paper_elements(i, paper, is_last=i == len(papers)) for i, paper in enumerate(papers, 1))
+        ))
 
         # 构建卡片
         card = {
-            "config": {
-                "wide_screen_mode": True
-            },
-            "header": {
-                "title": {
-                    "tag": "plain_text",
-                    "content": "🤖 Hugging Face Daily Papers"
-                },
-                "template": "blue"
-            },
+            "config": CARD_CONFIG,
+            "header": PAPERS_CARD_HEADER,
             "elements": elements
         }
 
         return card
 
+    @staticmethod
+    def _paper_elements(i: int, paper: Dict, is_last: bool) -> Iterator[Dict]:
+        """
+        逐个产出单篇论文在卡片中的元素
+
+        Args:
+            i: 论文序号（从 1 开始）
+            paper: 论文信息
+            is_last: 是否为最后一篇（最后一篇后面不加分隔线）
+        """
+        # 每个字段只查一次字典
+        author_str = paper.get('author_str')
+        published = paper.get('published')
+        summary = paper.get('summary', '')
+        paper_url = paper.get('paper_url')
+        pdf_url = paper.get('pdf_url')
+
+        # 论文标题
+        yield _md_div(f"**{i}. {paper['title']}**")
+
+        # 作者
+        if author_str:
+            yield _md_div(f"👥 {author_str}")
+
+        # 发布时间
+        if published:
+            yield _md_div(f"📅 {published}")
+
+        # 摘要（截断）
+        if summary:
+            yield _md_div(f"📝 {_truncate(summary, SUMMARY_PREVIEW_CHARS)}")
+
+        # 按钮链接
+        actions = []
+        if paper_url:
+            actions.append({
+                "tag": "button",
+                "text": VIEW_PAPER_BUTTON_TEXT,
+                "type": "default",
+                "url": paper_url
+            })
+        if pdf_url:
+            actions.append({
+                "tag": "button",
+                "text": PDF_BUTTON_TEXT,
+                "type": "primary",
+                "url": pdf_url
+            })
+        if actions:
+            yield {
+                "tag": "action",
+                "actions": actions
+            }
+
+        # 分隔线（除了最后一篇）
+        if not is_last:
+            yield HR_ELEMENT
+
     def send_papers(self, papers: List[Dict], use_card: bool = True) -> bool:
         """
         发送论文推送
@@ -234,44 +290,95 @@ class FeishuBotPusher:
         Returns:
             富文本内容列表
         """
-        content = []
-
-        for i, paper in enumerate(papers, 1):
-            # 标题
-            content.append([
-                {
-                    "tag": "text",
-                    "text": f"{i}. ",
-                    "style": ["bold"]
-                },
-                {
-                    "tag": "text",
-                    "text": paper['title'],
-                    "style": ["bold"]
-                }
-            ])
-
-            # 作者
-            if paper.get('author_str'):
-                content.append([
-                    {
-                        "tag": "text",
-                        "text": f"作者: {paper['author_str']}\n"
-                    }
-                ])
-
-            # 摘要
-            summary = paper.get('summary', '')
-            if summary:
-                summary_preview = summary[:150] + '...' if len(summary) > 150 else summary
-                content.append([
-                    {
-                        "tag": "text",
-                        "text": f"{summary_preview}\n\n"
-                    }
-                ])
+        return list(chain.from_iterable(
+            self._paper_post_rows(i, paper) for i, paper in enumerate(papers, 1)
+        ))
+
+    @staticmethod
+    def _paper_post_rows(i: int, paper: Dict) -> Iterator[List[Dict[str, str]]]:
+        """
+        逐行产出单篇论文的富文本内容
+
+        Args:
+            i: 论文序号（从 1 开始）
+            paper: 论文信息
+        """
+        # 标题
+        yield [
+            {
+                "tag": "text",
+                "text": f"{i}. ",
+                "style": ["bold"]
+            },
+            {
+                "tag": "text",
+                "text": paper['title'],
+                "style": ["bold"]
+            }
+        ]
+
+        # 作者
+        author_str = paper.get('author_str')
+        if author_str:
+            yield [{"tag": "text", "text": f"作者: {author_str}\n"}]
 
-        return content
+        # 摘要
+        summary = paper.get('summary', '')
+        if summary:
+            yield [{"tag": "text", "text": f"{_truncate(summary, SUMMARY_PREVIEW_CHARS)}\n\n"}]
+
+    def send_many(self, payloads: List[Dict]) -> List[bool]:
+        """
+        批量发送多条消息：同一个群内按顺序发送（保证消息顺序），不同群之间并发
+
+        Args:
+            payloads: 消息 payload 列表
+
+        Returns:
+            每条消息是否发送成功（所有群都成功才算成功）
+        """
+        if not self.webhook_urls:
+            logger.error("❌ 没有配置飞书 Webhook URL")
+            return [False] * len(payloads)
+
+        # 每条消息只序列化一次，各群和每次重试都复用同一份字节串
+        bodies = [_dumps(payload) for payload in payloads]
+
+        def send_all_to(idx: int, webhook_url: str) -> List[bool]:
+            return [self._send_to(idx, webhook_url, body) for body in bodies]
+
+        targets = list(enumerate(self.webhook_urls, 1))
+        if len(targets) == 1:
+            per_group = [send_all_to(*targets[0])]
+        else:
+            # 每个群一个线程，共享 get_session() 的连接池
+            with ThreadPoolExecutor(max_workers=min(POOL_SIZE, len(targets))) as executor:
+                per_group = list(executor.map(lambda target: send_all_to(*target), targets))
+
+        return [all(results) for results in zip(*per_group)]
+
+    def send_papers_batched(self, papers: List[Dict], chunk: int = 10, use_card: bool = True) -> bool:
+        """
+        论文较多时按 chunk 篇一组拆成多条消息发送
+
+        Args:
+            papers: 论文列表
+            chunk: 每条消息的论文数
+            use_card: 是否使用卡片格式（推荐）
+
+        Returns:
+            是否全部发送成功
+        """
+        payloads = []
+        for start in range(0, len(papers), chunk):
+            batch = papers[start:start + chunk]
+            if use_card:
+                payloads.append(self._card_payload(self.format_papers_card(batch)))
+            else:
+                title = f"📚 Hugging Face Daily Papers ({len(batch)} 篇)"
+                payloads.append(self._post_payload(title, self._format_post_content(batch)))
+
+        return all(self.send_many(payloads))
 
     def _send(self, payload: Dict) -> bool:
         """
@@ -283,45 +390,48 @@ class FeishuBotPusher:
         Returns:
             是否发送成功（所有群都成功才算成功）
         """
-        if not self.webhook_urls:
-            print("❌ 没有配置飞书 Webhook URL")
-            return False
-
-        import time as _time
-        all_success = True
-        for idx, webhook_url in enumerate(self.webhook_urls, 1):
-            success = False
-            for attempt in range(3):
-                try:
-                    response = self.session.post(
-                        webhook_url,
-                        json=payload,
-                        timeout=10
-                    )
-                    response.raise_for_status()
-
-                    result = response.json()
-
-                    if result.get('code') == 0:
-                        print(f"✅ 飞书消息发送成功 (群 {idx}/{len(self.webhook_urls)})")
-                        success = True
-                        break
-                    else:
-                        print(f"❌ 飞书消息发送失败 (群 {idx}/{len(self.webhook_urls)}): {result}")
-                        if attempt < 2:
-                            print(f"  ↻ 重试 ({attempt + 2}/3)...")
-                            _time.sleep(2)
-
-                except requests.RequestException as e:
-                    print(f"❌ 请求异常 (群 {idx}/{len(self.webhook_urls)}): {e}")
+        return self.send_many([payload])[0]
+
+    def _send_to(self, idx: int, webhook_url: str, body: bytes) -> bool:
+        """
+        发送消息到单个群（失败最多重试 2 次）
+
+        Args:
+            idx: 群序号（从 1 开始，仅用于日志）
+            webhook_url: 该群的 Webhook URL
+            body: 已序列化的消息 payload（JSON 字节串）
+
+        Returns:
+            是否发送成功
+        """
+        for attempt in range(3):
+            try:
+                response = self.session.post(
+                    webhook_url,
+                    data=body,
+                    headers=JSON_HEADERS,
+                    timeout=10
+                )
+                response.raise_for_status()
+
+                result = _loads(response.content)
+
+                if result.get('code') == 0:
+                    logger.info("✅ 飞书消息发送成功 (群 %d/%d)", idx, len(self.webhook_urls))
+                    return True
+                else:
+                    logger.error("❌ 飞书消息发送失败 (群 %d/%d): %s", idx, len(self.webhook_urls), result)
                     if attempt < 2:
-                        print(f"  ↻ 重试 ({attempt + 2}/3)...")
-                        _time.sleep(2)
+                        logger.warning("  ↻ 重试 (%d/3)...", attempt + 2)
+                        time.sleep(2)
 
-            if not success:
-                all_success = False
+            except (requests.RequestException, ValueError) as e:
+                logger.error("❌ 请求异常 (群 %d/%d): %s", idx, len(self.webhook_urls), e)
+                if attempt < 2:
+                    logger.warning("  ↻ 重试 (%d/3)...", attempt + 2)
+                    time.sleep(2)
 
-        return all_success
+        return False
 
 
 def get_pusher_from_env() -> Optional[FeishuBotPusher]:
@@ -335,8 +445,6 @@ def get_pusher_from_env() -> Optional[FeishuBotPusher]:
     Returns:
         FeishuBotPusher 实例，如果未配置则返回 None
     """
-    import os
-
     webhook_url = os.getenv('FEISHU_WEBHOOK_URL')
     webhook_urls_str = os.getenv('FEISHU_WEBHOOK_URLS', '')
 
@@ -356,7 +464,7 @@ def get_pusher_from_env() -> Optional[FeishuBotPusher]:
 
 # 测试代码
 if __name__ == "__main__":
-    import os
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
 
     # 测试文本消息
     webhook_url = os.getenv('FEISHU_WEBHOOK_URL')
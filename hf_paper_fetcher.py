@@ -4,11 +4,57 @@
 获取 Hugging Face Daily Papers 的最新论文
 """
 
+import json
+import logging
 import requests
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-import time
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# 多模式匹配：安装了 pyahocorasick 时用 Aho-Corasick 自动机一次扫描检测全部类别关键词
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# JSON 解析：安装了 orjson（Rust 实现）时优先使用，否则退回标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 连接池大小，也是按日期并发请求的最大线程数
+POOL_SIZE = 4
+
+# 不超过该长度的关键词按完整单词匹配（避免 "rl" 匹配 "url"）
+SHORT_KEYWORD_LEN = 4
+
+
+@lru_cache(maxsize=4)
+def _make_session(user_agent: str) -> requests.Session:
+    """按 User-Agent 创建并缓存模块级共享的 requests.Session"""
+    session = requests.Session()
+    session.headers['User-Agent'] = user_agent
+    session.headers['Accept'] = 'application/json'
+    # requests 默认只声明 gzip/deflate；安装了 brotli 时额外声明 br（只声明能解码的格式）
+    session.headers['Accept-Encoding'] = ACCEPT_ENCODING.replace(',', ', ')
+
+    # 限流和 5xx 等瞬时错误由 urllib3 按指数退避自动重试（会参考 Retry-After 头）
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=('GET',))
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
 
 
 class HuggingFacePaperFetcher:
@@ -16,6 +62,7 @@ class HuggingFacePaperFetcher:
 
     BASE_URL = "https://huggingface.co"
     DAILY_PAPERS_API = "/api/daily_papers"
+    USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
 
     # 默认类别关键词
     DEFAULT_CATEGORIES = {
@@ -84,11 +131,10 @@ class HuggingFacePaperFetcher:
         """
         self.days_back = days_back
         self.max_papers = max_papers
-        self.category_filters = category_filters
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        })
+        # 转为 frozenset，过滤时用集合运算；空列表与 None 一样表示不过滤
+        self.category_filters = frozenset(category_filters) if category_filters else None
+        # 多个实例（如不同类别过滤）共享同一个 Session，连接池保持热连接
+        self.session = _make_session(self.USER_AGENT)
 
     def fetch_papers(self, date: Optional[str] = None) -> List[Dict]:
         """
@@ -107,11 +153,11 @@ class HuggingFacePaperFetcher:
         params = {'date': date, 'limit': self.max_papers}
 
         try:
-            print(f"📅 获取 {date} 的 Hugging Face Daily Papers...")
+            logger.info("📅 获取 %s 的 Hugging Face Daily Papers...", date)
             response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
+            data = _loads(response.content)
             papers = []
 
             for item in data:
@@ -119,11 +165,11 @@ class HuggingFacePaperFetcher:
                 if paper:
                     papers.append(paper)
 
-            print(f"✅ 获取到 {len(papers)} 篇论文")
+            logger.info("✅ 获取到 %d 篇论文", len(papers))
             return papers
 
-        except requests.RequestException as e:
-            print(f"❌ 请求失败: {e}")
+        except (requests.RequestException, ValueError) as e:
+            logger.error("❌ 请求失败: %s", e)
             return []
 
     def fetch_trending_papers(self) -> List[Dict]:
@@ -136,7 +182,7 @@ class HuggingFacePaperFetcher:
         url = f"{self.BASE_URL}/papers/trending"
 
         try:
-            print("🔥 获取 Hugging Face 热门论文...")
+            logger.info("🔥 获取 Hugging Face 热门论文...")
             # 注意：trending 页面是动态渲染的，这里使用 API
             # 实际上 trending 数据也在 daily_papers API 中，通过排序获取
             response = self.session.get(f"{self.BASE_URL}{self.DAILY_PAPERS_API}",
@@ -144,7 +190,7 @@ class HuggingFacePaperFetcher:
                                       timeout=30)
             response.raise_for_status()
 
-            data = response.json()
+            data = _loads(response.content)
             papers = []
 
             for item in data[:self.max_papers]:
@@ -152,11 +198,11 @@ class HuggingFacePaperFetcher:
                 if paper:
                     papers.append(paper)
 
-            print(f"✅ 获取到 {len(papers)} 篇热门论文")
+            logger.info("✅ 获取到 %d 篇热门论文", len(papers))
             return papers
 
-        except requests.RequestException as e:
-            print(f"❌ 请求失败: {e}")
+        except (requests.RequestException, ValueError) as e:
+            logger.error("❌ 请求失败: %s", e)
             return []
 
     def _parse_paper(self, item: Dict) -> Optional[Dict]:
@@ -178,13 +224,20 @@ class HuggingFacePaperFetcher:
             title = paper_data.get('title', '')
             summary = paper_data.get('summary', '')
 
+            # 检测类别
+            categories = self._detect_categories(title, summary)
+
+            # 类别过滤（先于其余字段的提取，被过滤的论文不做多余的工作）
+            if self.category_filters is not None and self.category_filters.isdisjoint(categories):
+                return None  # 不在需要的类别中，跳过
+
             # 发布时间（可能是 publishedAt 或其他字段）
             published = paper_data.get('publishedAt', paper_data.get('published', paper_data.get('date', '')))
 
             # 提取作者
             authors_list = paper_data.get('authors', [])
-            author_names = [a.get('name', '') for a in authors_list if a.get('name')]
-            author_list = ', '.join(author_names[:5])  # 只取前5个作者
+            author_names = [name for a in authors_list if (name := a.get('name'))]
+            author_list = ', '.join(islice(author_names, 5))  # 只取前5个作者
 
             # 构建论文 URL
             paper_url = f"{self.BASE_URL}/papers/{paper_id}"
@@ -198,13 +251,6 @@ class HuggingFacePaperFetcher:
             github_repo = paper_data.get('githubRepo', '')
             ai_summary = paper_data.get('ai_summary', '')
 
-            # 检测类别
-            categories = self._detect_categories(title, summary)
-
-            # 类别过滤
-            if self.category_filters and not any(cat in self.category_filters for cat in categories):
-                return None  # 不在需要的类别中，跳过
-
             # 相关性评分
             upvotes = item.get('paper', {}).get('upvotes', 0) if isinstance(item.get('paper'), dict) else item.get('upvotes', 0)
             score = upvotes * 2 + len(categories) * 10 + (5 if project_page else 0) + (3 if github_repo else 0)
@@ -228,7 +274,7 @@ class HuggingFacePaperFetcher:
             }
 
         except Exception as e:
-            print(f"⚠️  解析论文数据失败: {e}")
+            logger.warning("⚠️  解析论文数据失败: %s", e)
             return None
 
     def _detect_categories(self, title: str, summary: str) -> List[str]:
@@ -244,20 +290,24 @@ class HuggingFacePaperFetcher:
         """
         text = f"{title} {summary}".lower()
 
+        if _CATEGORY_AUTOMATON is not None:
+            # 一次扫描找出所有关键词出现位置，短关键词再检查词边界
+            found = set()
+            for end, (kw_lower, categories) in _CATEGORY_AUTOMATON.iter(text):
+                start = end + 1 - len(kw_lower)
+                if len(kw_lower) <= SHORT_KEYWORD_LEN and not _at_word_boundary(text, start, end + 1):
+                    continue
+                found.update(categories)
+            return [category for category in self.DEFAULT_CATEGORIES if category in found]
+
         detected = []
 
-        for category, keywords in self.DEFAULT_CATEGORIES.items():
-            for keyword in keywords:
-                kw_lower = keyword.lower()
-                if len(kw_lower) <= 4:
-                    # 短关键词用 word boundary，避免 "rl" 匹配 "url"
-                    if re.search(r'\b' + re.escape(kw_lower) + r'\b', text):
-                        detected.append(category)
-                        break
-                else:
-                    if kw_lower in text:
-                        detected.append(category)
-                        break
+        for category, matchers in _CATEGORY_MATCHERS:
+            for kw_lower, pattern in matchers:
+                # 短关键词用 word boundary，避免 "rl" 匹配 "url"
+                if (pattern.search(text) if pattern else kw_lower in text):
+                    detected.append(category)
+                    break
 
         return detected
 
@@ -268,31 +318,79 @@ class HuggingFacePaperFetcher:
         Returns:
             论文列表
         """
-        all_papers = []
-        seen_ids = set()  # 去重
-
-        for i in range(self.days_back):
-            date = (datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d')
-            papers = self.fetch_papers(date)
+        merged: Dict[str, Dict] = {}  # paper_id -> 论文，按 id 去重并保留首次出现的顺序
 
-            for paper in papers:
-                if paper['paper_id'] not in seen_ids:
-                    seen_ids.add(paper['paper_id'])
-                    all_papers.append(paper)
-
-            if len(all_papers) >= self.max_papers:
-                break
+        # 各日期并发请求（复用同一 Session 的连接池），结果仍按日期从近到远合并
+        dates = [(datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(self.days_back)]
+        executor = ThreadPoolExecutor(max_workers=max(1, min(len(dates), POOL_SIZE)))
+        try:
+            for papers in executor.map(self.fetch_papers, dates):
+                for paper in papers:
+                    merged.setdefault(paper['paper_id'], paper)
 
-            time.sleep(0.5)  # 避免请求过快
+                if len(merged) >= self.max_papers:
+                    break
+        finally:
+            # 凑够论文后取消还在排队的日期请求，也不等待已在进行中的请求返回
+            executor.shutdown(wait=False, cancel_futures=True)
 
         # 按相关性评分排序
+        all_papers = list(merged.values())
         all_papers.sort(key=lambda p: p.get('relevance_score', 0), reverse=True)
 
         return all_papers[:self.max_papers]
 
 
+def _loads(content: bytes):
+    """解析 JSON 响应体"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _at_word_boundary(text: str, start: int, end: int) -> bool:
+    """text[start:end] 两侧是否都是词边界（关键词首尾都是单词字符时，等价于正则的 \\b）"""
+    before = text[start - 1] if start > 0 else ''
+    after = text[end] if end < len(text) else ''
+    return not (before.isalnum() or before == '_') and not (after.isalnum() or after == '_')
+
+
+def _build_category_matchers(categories: Dict[str, List[str]]):
+    """
+    预处理类别关键词（导入时执行一次）
+
+    Returns:
+        (类别 -> [(小写关键词, 短关键词的词边界正则或 None)] 列表, Aho-Corasick 自动机或 None)
+    """
+    matchers = []
+    owners: Dict[str, List[str]] = {}
+    for category, keywords in categories.items():
+        category_matchers = []
+        for keyword in keywords:
+            kw_lower = keyword.lower()
+            pattern = re.compile(r'\b' + re.escape(kw_lower) + r'\b') if len(kw_lower) <= SHORT_KEYWORD_LEN else None
+            category_matchers.append((kw_lower, pattern))
+            # 同一关键词可能属于多个类别（如 vision-language）
+            owners.setdefault(kw_lower, []).append(category)
+        matchers.append((category, category_matchers))
+
+    automaton = None
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for kw_lower, owner_categories in owners.items():
+            automaton.add_word(kw_lower, (kw_lower, tuple(owner_categories)))
+        automaton.make_automaton()
+
+    return matchers, automaton
+
+
+_CATEGORY_MATCHERS, _CATEGORY_AUTOMATON = _build_category_matchers(HuggingFacePaperFetcher.DEFAULT_CATEGORIES)
+
+
 # 测试代码
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     fetcher = HuggingFacePaperFetcher(days_back=1, max_papers=5)
     papers = fetcher.fetch_recent_papers()
 
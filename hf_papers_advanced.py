@@ -10,11 +10,17 @@
 import os
 import sys
 import json
+import atexit
+import logging
+import logging.handlers
+import queue
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 
 from hf_paper_fetcher import HuggingFacePaperFetcher
 from blog_fetcher import BlogFetcher
-from ai_summarizer import AISummarizer, get_summarizer_from_env
+from ai_summarizer import AISummarizer, TREND_SYSTEM, get_summarizer_from_env
 from feishu_pusher import FeishuBotPusher, get_pusher_from_env
 from classic_papers_extended import ClassicPaperFetcher, format_classic_paper_card
 
@@ -44,6 +50,8 @@ BLOG_SOURCES = [s.strip() for s in BLOG_SOURCES.split(',') if s.strip()]
 # AI 摘要配置（默认启用）
 ENABLE_AI_SUMMARY = os.getenv('HF_ENABLE_AI_SUMMARY', 'true').lower() == 'true'
 AI_PROVIDER = os.getenv('AI_PROVIDER', 'claude')  # 默认用 Claude
+# 把所有论文合并为一次 API 调用生成摘要（省时省 token，但单篇解读质量可能略降）
+COMBINED_SUMMARY = os.getenv('HF_COMBINED_SUMMARY', 'false').lower() == 'true'
 
 # 是否包含经典论文
 INCLUDE_CLASSIC = os.getenv('HF_INCLUDE_CLASSIC', 'true').lower() == 'true'
@@ -51,14 +59,51 @@ INCLUDE_CLASSIC = os.getenv('HF_INCLUDE_CLASSIC', 'true').lower() == 'true'
 # 是否包含 Twitter 推文
 ENABLE_TWITTER = os.getenv('HF_ENABLE_TWITTER', 'false').lower() == 'true'
 
+# 日志级别（DEBUG 时输出每条摘要的生成详情）
+LOG_LEVEL = os.getenv('HF_LOG_LEVEL', 'INFO').upper()
+
 # Dry-run 模式（只获取不推送）
 DRY_RUN = os.getenv('HF_DRY_RUN', 'false').lower() == 'true' or '--dry-run' in sys.argv
 
+# 卡片中多次复用的固定元素（只读，序列化时共享同一个 dict 即可）
+HR_ELEMENT = {"tag": "hr"}
+CARD_CONFIG = {"wide_screen_mode": True}
+DAILY_CARD_HEADER = {
+    "title": {
+        "tag": "plain_text",
+        "content": "🤖 AI Research Daily"
+    },
+    "template": "blue"
+}
+
 
 # ============ 主逻辑 ============
 
+def setup_logging():
+    """
+    配置日志：工作线程只把日志放入队列，由后台 QueueListener 线程负责输出，
+    并发生成摘要时不会因为抢占 stdout 而互相阻塞
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    atexit.register(listener.stop)
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(LOG_LEVEL)
+
+    # SDK 底层的 httpx 在 INFO 级别会逐条打印请求，保持安静
+    for name in ('httpx', 'httpcore'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+
+@lru_cache(maxsize=1024)
 def format_datetime(date_str: str) -> str:
-    """格式化日期时间"""
+    """格式化日期时间（同一批 feed 中的时间戳经常重复，结果按字符串缓存）"""
     try:
         dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
         return dt.strftime('%Y-%m-%d %H:%M')
@@ -69,6 +114,10 @@ def format_datetime(date_str: str) -> str:
 def generate_trend_summary(summarizer, papers: list, blogs: list, prev_summary: str = '') -> str:
     """生成研究趋势总结，可参考昨日内容体现延续性"""
     try:
+        # 没有中转时只有 OpenAI / Claude 有可用的接口（Gemini 的 key 不能发给 api.openai.com），直接跳过
+        if not os.getenv('OPENAI_BASE_URL') and summarizer.provider not in ('openai', 'claude'):
+            return None
+
         content_parts = []
 
         if papers:
@@ -102,35 +151,9 @@ def generate_trend_summary(summarizer, papers: list, blogs: list, prev_summary:
 
 简洁直接。"""
 
-        # 调用 LLM 生成趋势总结
-        import os
-        if os.getenv('OPENAI_BASE_URL') or summarizer.provider == 'openai':
-            import openai
-            base_url = os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1')
-            if not base_url.endswith('/v1'):
-                base_url = base_url.rstrip('/') + '/v1'
-
-            client = openai.OpenAI(api_key=summarizer.api_key, base_url=base_url)
-
-            response = client.chat.completions.create(
-                model=summarizer.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "你是一个 AI 研究趋势分析师，擅长从大量研究内容中提炼关键趋势。"
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=800,
-                temperature=0.7
-            )
-
-            summary = response.choices[0].message.content.strip()
-            print(f"✅ 趋势总结生成成功，长度: {len(summary)} 字符")
-            return summary
+        summary = summarizer.complete(TREND_SYSTEM, prompt, max_tokens=800)
+        print(f"✅ 趋势总结生成成功，长度: {len(summary)} 字符")
+        return summary
 
     except Exception as e:
         print(f"⚠️  趋势总结生成失败: {e}")
@@ -176,6 +199,7 @@ def dedup_items(items: list, history_key: dict, id_field: str) -> list:
 
 def main():
     """主函数"""
+    setup_logging()
 
     print("=" * 60)
     print("🤖 HF Daily Papers + 博客 高级推送机器人")
@@ -242,7 +266,11 @@ def main():
         for i, paper in enumerate(papers):
             print(f"  [{i+1}/{len(papers)}] {paper['title'][:40]}...")
 
-            summary = summarizer.summarize_paper(paper, use_hf_summary=False, prev_context=prev_context)
+        if COMBINED_SUMMARY:
+            summaries = summarizer.summarize_papers_combined(papers, prev_context=prev_context)
+        else:
+            summaries = summarizer.summarize_papers_batch(papers, use_hf_summary=False, prev_context=prev_context)
+        for paper, summary in zip(papers, summaries):
             if summary:
                 paper['ai_enhanced_summary'] = summary
             else:
@@ -277,11 +305,10 @@ def main():
         print(f"\n🤖 生成博客 AI 解读...")
         for i, blog in enumerate(blogs):
             print(f"  [{i+1}/{len(blogs)}] {blog['title'][:40]}...")
-            summary = summarizer.summarize_blog(blog)
-            if summary:
-                blog['ai_summary'] = summary
-            else:
-                blog['ai_summary'] = None
+
+        summaries = summarizer.summarize_blogs_batch(blogs)
+        for blog, summary in zip(blogs, summaries):
+            blog['ai_summary'] = summary or None
 
     # 去重：排除已推送过的博客
     if blogs:
@@ -358,6 +385,11 @@ def main():
     print("📝 构建推送消息")
     print("=" * 60)
 
+    # 发布时间只格式化一次，构建卡片时直接拼接
+    for item in (*papers, *blogs):
+        if item.get('published'):
+            item['published_fmt'] = format_datetime(item['published'])
+
     card = build_enhanced_card(papers, blogs, classic_paper, trend_summary, tweets)
     print(f"✅ 构建完成")
 
@@ -419,279 +451,147 @@ def main():
     return 0
 
 
+def _md_div(content: str) -> dict:
+    """构建 lark_md 文本块元素"""
+    return {"tag": "div", "text": {"tag": "lark_md", "content": content}}
+
+
+def _button(text: str, url: str, button_type: str = 'default') -> dict:
+    """构建链接按钮"""
+    return {"tag": "button", "text": {"tag": "plain_text", "content": text}, "type": button_type, "url": url}
+
+
+def _render_paper(i: int, paper: dict, is_last: bool) -> tuple:
+    """构建单篇论文在卡片中的元素（标题、元信息、摘要、按钮、分隔线）"""
+    # 标题
+    title_text = f"**{i}. {paper['title']}**"
+    if paper.get('categories'):
+        tags = ' '.join([f"`{cat}`" for cat in paper['categories'][:3]])
+        title_text += f"\n🏷️  {tags}"
+    rendered = [_md_div(title_text)]
+
+    # 作者和发布时间
+    meta_lines = []
+    if paper.get('author_str'):
+        meta_lines.append(f"👥 {paper['author_str']}")
+    if paper.get('published'):
+        meta_lines.append(f"📅 {paper.get('published_fmt') or format_datetime(paper['published'])}")
+    if meta_lines:
+        rendered.append(_md_div(' | '.join(meta_lines)))
+
+    # 摘要（AI 解读优先）
+    if paper.get('ai_enhanced_summary'):
+        summary = paper['ai_enhanced_summary']
+        if len(summary) > 600:
+            summary = summary[:600] + '...'
+        rendered.append(_md_div(summary))
+    elif paper.get('summary'):
+        # 原始摘要
+        summary = paper['summary']
+        if len(summary) > 300:
+            summary = summary[:300] + '...'
+        rendered.append(_md_div(f"📝 {summary}"))
+
+    # 链接按钮
+    actions = [_button("查看论文", paper['paper_url'])]
+    if paper.get('pdf_url'):
+        actions.append(_button("下载 PDF", paper['pdf_url'], 'primary'))
+    if paper.get('project_page'):
+        actions.append(_button("项目主页", paper['project_page']))
+    rendered.append({"tag": "action", "actions": actions})
+
+    # 分隔线
+    if not is_last:
+        rendered.append(HR_ELEMENT)
+    return tuple(rendered)
+
+
 def build_enhanced_card(papers: list, blogs: list, classic_paper: dict = None, trend_summary: str = None, tweets: list = None) -> dict:
     """构建增强版飞书卡片"""
 
-    elements = []
-
     # ========== 标题区 ==========
     now = datetime.now().strftime('%Y-%m-%d %H:%M')
 
-    elements.append({
-        "tag": "div",
-        "text": {
-            "tag": "lark_md",
-            "content": f"**📊 论文: {len(papers)} 篇 | 博客: {len(blogs)} 篇**\n**⏰ {now}**"
-        }
-    })
-
-    elements.append({"tag": "hr"})
+    elements = [
+        _md_div(f"**📊 论文: {len(papers)} 篇 | 博客: {len(blogs)} 篇**\n**⏰ {now}**"),
+        HR_ELEMENT
+    ]
 
     # ========== 趋势总结区 ==========
     if trend_summary:
-        elements.append({
-            "tag": "div",
-            "text": {
-                "tag": "lark_md",
-                "content": f"**📈 今日研究趋势**\n\n{trend_summary}"
-            }
-        })
-
-        elements.append({"tag": "hr"})
+        elements += (_md_div(f"**📈 今日研究趋势**\n\n{trend_summary}"), HR_ELEMENT)
 
     # ========== 经典论文区（放在前面） ==========
     if classic_paper:
-        elements.append({
-            "tag": "div",
-            "text": {
-                "tag": "lark_md",
-                "content": "**📖 每日经典论文推荐**"
-            }
-        })
-
         # 经典论文内容
-        classic_content = f"**{classic_paper['title']}** ({classic_paper.get('year', 'N/A')})\n\n"
-        classic_content += f"👥 **作者**: {classic_paper['authors']}\n\n"
+        parts = [
+            f"**{classic_paper['title']}** ({classic_paper.get('year', 'N/A')})\n\n",
+            f"👥 **作者**: {classic_paper['authors']}\n\n",
+        ]
 
         # AI 解读优先，否则用静态描述
         if classic_paper.get('ai_summary'):
-            classic_content += f"{classic_paper['ai_summary']}\n\n"
+            parts.append(f"{classic_paper['ai_summary']}\n\n")
         else:
-            classic_content += f"📝 **简介**: {classic_paper['description']}\n\n"
+            parts.append(f"📝 **简介**: {classic_paper['description']}\n\n")
 
         # 关键词
         keywords = classic_paper.get('keywords', [])
         if keywords:
-            classic_content += f"🔑 **核心概念**: {', '.join(keywords[:5])}"
-            if len(keywords) > 5:
-                classic_content += f" 等 {len(keywords)} 个关键词"
-            classic_content += "\n\n"
-
-        elements.append({
-            "tag": "div",
-            "text": {
-                "tag": "lark_md",
-                "content": classic_content
-            }
-        })
-
-        elements.append({
-            "tag": "action",
-            "actions": [
-                {
-                    "tag": "button",
-                    "text": {"tag": "plain_text", "content": "查看论文"},
-                    "type": "default",
-                    "url": classic_paper['url']
-                }
-            ]
-        })
-
-        elements.append({"tag": "hr"})
+            more = f" 等 {len(keywords)} 个关键词" if len(keywords) > 5 else ""
+            parts.append(f"🔑 **核心概念**: {', '.join(keywords[:5])}{more}\n\n")
+
+        elements += (
+            _md_div("**📖 每日经典论文推荐**"),
+            _md_div(''.join(parts)),
+            {"tag": "action", "actions": [_button("查看论文", classic_paper['url'])]},
+            HR_ELEMENT
+        )
 
     # ========== 论文区 ==========
     if papers:
-        elements.append({
-            "tag": "div",
-            "text": {
-                "tag": "lark_md",
-                "content": "**📚 Hugging Face 论文**"
-            }
-        })
-
-        for i, paper in enumerate(papers, 1):
-            # 标题
-            title_text = f"**{i}. {paper['title']}**"
-            if paper.get('categories'):
-                tags = ' '.join([f"`{cat}`" for cat in paper['categories'][:3]])
-                title_text += f"\n🏷️  {tags}"
-
-            elements.append({
-                "tag": "div",
-                "text": {
-                    "tag": "lark_md",
-                    "content": title_text
-                }
-            })
-
-            # 作者和发布时间
-            meta_lines = []
-            if paper.get('author_str'):
-                meta_lines.append(f"👥 {paper['author_str']}")
-            if paper.get('published'):
-                meta_lines.append(f"📅 {format_datetime(paper['published'])}")
-
-            if meta_lines:
-                elements.append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": ' | '.join(meta_lines)
-                    }
-                })
-
-            # 摘要（AI 解读优先）
-            if paper.get('ai_enhanced_summary'):
-                summary = paper['ai_enhanced_summary']
-                if len(summary) > 600:
-                    summary = summary[:600] + '...'
-                elements.append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": summary
-                    }
-                })
-            elif paper.get('summary'):
-                # 原始摘要
-                summary = paper['summary']
-                if len(summary) > 300:
-                    summary = summary[:300] + '...'
-                elements.append({
-                    "tag": "div",
-                    "text": {
-                        "tag": "lark_md",
-                        "content": f"📝 {summary}"
-                    }
-                })
-
-            # 链接按钮
-            actions = [
-                {
-                    "tag": "button",
-                    "text": {"tag": "plain_text", "content": "查看论文"},
-                    "type": "default",
-                    "url": paper['paper_url']
-                }
-            ]
-
-            if paper.get('pdf_url'):
-                actions.append({
-                    "tag": "button",
-                    "text": {"tag": "plain_text", "content": "下载 PDF"},
-                    "type": "primary",
-                    "url": paper['pdf_url']
-                })
-
-            if paper.get('project_page'):
-                actions.append({
-                    "tag": "button",
-                    "text": {"tag": "plain_text", "content": "项目主页"},
-                    "type": "default",
-                    "url": paper['project_page']
-                })
-
-            elements.append({
-                "tag": "action",
-                "actions": actions
-            })
-
-            # 分隔线
-            if i < len(papers):
-                elements.append({"tag": "hr"})
+        elements.append(_md_div("**📚 Hugging Face 论文**"))
+        last = len(papers)
+        elements.extend(chain.from_iterable(
+            _render_paper(i, paper, i == last) for i, paper in enumerate(papers, 1)
+        ))
 
     # ========== 博客区 ==========
     if blogs:
-        elements.append({"tag": "hr"})
-        elements.append({
-            "tag": "div",
-            "text": {
-                "tag": "lark_md",
-                "content": "**📰 实验室博客**"
-            }
-        })
-
-        for blog in blogs[:5]:  # 最多显示 5 篇
-            # 标题和元信息
-            elements.append({
-                "tag": "div",
-                "text": {
-                    "tag": "lark_md",
-                    "content": f"**• {blog['title']}**\n🏢 {blog['source']} | 📅 {format_datetime(blog['published'])}"
-                }
-            })
-
-            # 链接按钮
-            elements.append({
-                "tag": "action",
-                "actions": [
-                    {
-                        "tag": "button",
-                        "text": {"tag": "plain_text", "content": "阅读文章"},
-                        "type": "default",
-                        "url": blog['link']
-                    }
-                ]
-            })
+        elements += (HR_ELEMENT, _md_div("**📰 实验室博客**"))
+
+        shown_blogs = blogs[:5]  # 最多显示 5 篇
+        for idx, blog in enumerate(shown_blogs, 1):
+            # 标题和元信息、链接按钮
+            elements += (
+                _md_div(f"**• {blog['title']}**\n🏢 {blog['source']} | 📅 {blog.get('published_fmt') or format_datetime(blog['published'])}"),
+                {"tag": "action", "actions": [_button("阅读文章", blog['link'])]}
+            )
 
             # 分隔线
-            if blogs.index(blog) < min(len(blogs), 5) - 1:
-                elements.append({"tag": "hr"})
+            if idx < len(shown_blogs):
+                elements.append(HR_ELEMENT)
 
     # ========== 推文区 ==========
     if tweets:
-        elements.append({"tag": "hr"})
-        elements.append({
-            "tag": "div",
-            "text": {
-                "tag": "lark_md",
-                "content": "**🐦 AI 研究者推文**"
-            }
-        })
+        elements += (HR_ELEMENT, _md_div("**🐦 AI 研究者推文**"))
 
         for tweet in tweets[:5]:
             text = tweet['text']
             if len(text) > 150:
                 text = text[:150] + '...'
-            tweet_content = f"**@{tweet['username']}**\n{text}\n"
-            tweet_content += f"❤️ {tweet['likes']}  🔄 {tweet['retweets']}"
-
-            elements.append({
-                "tag": "div",
-                "text": {
-                    "tag": "lark_md",
-                    "content": tweet_content
-                }
-            })
+            elements.append(_md_div(f"**@{tweet['username']}**\n{text}\n❤️ {tweet['likes']}  🔄 {tweet['retweets']}"))
 
             if tweet.get('link'):
-                elements.append({
-                    "tag": "action",
-                    "actions": [{
-                        "tag": "button",
-                        "text": {"tag": "plain_text", "content": "查看推文"},
-                        "type": "default",
-                        "url": tweet['link']
-                    }]
-                })
+                elements.append({"tag": "action", "actions": [_button("查看推文", tweet['link'])]})
 
     # ========== 构建卡片 ==========
-    card = {
-        "config": {
-            "wide_screen_mode": True
-        },
-        "header": {
-            "title": {
-                "tag": "plain_text",
-                "content": "🤖 AI Research Daily"
-            },
-            "template": "blue"
-        },
+    return {
+        "config": CARD_CONFIG,
+        "header": DAILY_CARD_HEADER,
         "elements": elements
     }
 
-    return card
-
 
 if __name__ == "__main__":
     sys.exit(main())
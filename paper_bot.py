@@ -360,7 +360,7 @@ def handle_trending(chat_id, chat_type, sender_id, args):
     def _run():
         try:
             from hf_paper_fetcher import HuggingFacePaperFetcher
-            from ai_summarizer import get_summarizer_from_env
+            from ai_summarizer import get_openai_client, get_summarizer_from_env
             fetcher = HuggingFacePaperFetcher()
             papers = fetcher.fetch_papers()
 
@@ -372,12 +372,8 @@ def handle_trending(chat_id, chat_type, sender_id, args):
             titles = [p.get('title', '') for p in papers[:15]]
             content = "请用中文总结以下 AI 论文的研究趋势（3-5 个要点）：\n\n" + '\n'.join(f"- {t}" for t in titles)
 
-            # 直接用 openai client 调用
-            import openai
-            base_url = os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1')
-            if not base_url.endswith('/v1'):
-                base_url = base_url.rstrip('/') + '/v1'
-            client = openai.OpenAI(api_key=summarizer.api_key, base_url=base_url)
+            # 直接用 openai client 调用（复用进程内共享的连接池，恢复 SDK 默认的重试次数）
+            client = get_openai_client(summarizer.api_key).with_options(max_retries=2)
             resp = client.chat.completions.create(
                 model=summarizer.model,
                 messages=[{"role": "user", "content": content}],
@@ -515,6 +511,10 @@ def health():
 
 
 if __name__ == '__main__':
+    # 各抓取/摘要/推送模块通过 logging 输出进度，与主程序共用同一套日志配置（级别由 HF_LOG_LEVEL 控制）
+    from hf_papers_advanced import setup_logging
+    setup_logging()
+
     port = int(os.getenv('BOT_PORT', 5000))
     print(f"AI 论文机器人启动 - 端口 {port}")
     print(f"命令: /papers /blogs /tweets /trending /push /help")
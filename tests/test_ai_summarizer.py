@@ -0,0 +1,233 @@
+"""AISummarizer 论文 ID 缓存测试（用 mock 代替真实的 OpenAI 客户端，不发起网络请求）"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import disk_cache  # noqa: E402
+from ai_summarizer import COMBINED_CHUNK_SIZE, OPENAI_PAPER_MAX_TOKENS, AISummarizer  # noqa: E402
+from hf_paper_fetcher import HuggingFacePaperFetcher  # noqa: E402
+
+API_ITEM = {
+    'paper': {
+        'id': '2401.00001',
+        'title': 'Scaling Vision-Language Data Curation',
+        'summary': 'We study data curation strategies for vision-language model training.',
+        'authors': [{'name': 'Alice'}, {'name': 'Bob'}],
+        'publishedAt': '2024-01-02T00:00:00.000Z',
+        'upvotes': 10
+    }
+}
+
+
+def _fake_response(text: str):
+    """构造与 chat.completions.create 返回值结构一致的对象"""
+    choice = SimpleNamespace(message=SimpleNamespace(content=text), finish_reason='stop')
+    return SimpleNamespace(choices=[choice])
+
+
+class PaperIdCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        patcher = mock.patch.object(disk_cache, 'CACHE_DIR', self.tmpdir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.create = mock.Mock(return_value=_fake_response('解读内容'))
+        self.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=self.create)))
+
+    def _summarizer(self) -> AISummarizer:
+        summarizer = AISummarizer(provider='openai', api_key='test-key', model='gpt-4o-mini', warmup=False)
+        summarizer._get_openai_client = lambda: self.client
+        return summarizer
+
+    def test_parsed_paper_hits_id_cache_across_runs(self):
+        paper = HuggingFacePaperFetcher()._parse_paper(API_ITEM)
+        self.assertEqual(paper['paper_id'], '2401.00001')
+
+        first = self._summarizer().summarize_paper(paper, prev_context='昨日摘要 A')
+        self.assertEqual(self.create.call_count, 1)
+
+        # 新实例模拟第二天的运行：前一天上下文不同，按 prompt 的缓存无法命中，只能靠论文 ID 命中
+        second = self._summarizer().summarize_paper(paper, prev_context='昨日摘要 B')
+        self.assertEqual(self.create.call_count, 1)
+        self.assertEqual(first, second)
+
+
+    def test_blog_semantic_key_includes_content(self):
+        summarizer = self._summarizer()
+        summarizer._blog_semantic_cache = mock.Mock()
+        summarizer._blog_semantic_cache.get.return_value = None
+        blogs = [{'title': f'Weekly update #{n}', 'source': 'Lab Blog', 'full_content': f'第 {n} 期正文。' * 40}
+                 for n in (41, 42)]
+
+        for blog in blogs:
+            summarizer.summarize_blog(blog)
+        keys = [call.args[0] for call in summarizer._blog_semantic_cache.get.call_args_list]
+        self.assertEqual(len(keys), 2)
+        self.assertIn('第 41 期正文', keys[0])
+        self.assertIn('第 42 期正文', keys[1])
+
+    def _combined_reply(self, **kwargs):
+        """按请求中的论文数返回合并摘要 JSON"""
+        count = kwargs['messages'][1]['content'].count('**标题**')
+        summaries = [{'index': n, 'summary': f'解读 {n}'} for n in range(1, count + 1)]
+        return _fake_response(json.dumps({'summaries': summaries}, ensure_ascii=False))
+
+    def test_combined_results_are_cached_per_paper(self):
+        self.create.side_effect = self._combined_reply
+        fetcher = HuggingFacePaperFetcher()
+        papers = [fetcher._parse_paper({'paper': dict(API_ITEM['paper'], id=f'2401.0000{n}')}) for n in range(2)]
+
+        first = self._summarizer().summarize_papers_combined(papers, prev_context='昨日摘要 A')
+        self.assertEqual(self.create.call_count, 1)
+
+        second = self._summarizer().summarize_papers_combined(papers, prev_context='昨日摘要 B')
+        self.assertEqual(self.create.call_count, 1)
+        self.assertEqual(first, second)
+
+    def test_combined_requests_are_chunked(self):
+        self.create.side_effect = self._combined_reply
+        fetcher = HuggingFacePaperFetcher()
+        count = COMBINED_CHUNK_SIZE + 2
+        papers = [fetcher._parse_paper({'paper': dict(API_ITEM['paper'], id=f'2401.{n:05d}')}) for n in range(count)]
+
+        results = self._summarizer().summarize_papers_combined(papers)
+        self.assertTrue(all(results))
+        self.assertEqual(self.create.call_count, 2)
+        for call in self.create.call_args_list:
+            self.assertLessEqual(call.kwargs['max_tokens'], OPENAI_PAPER_MAX_TOKENS * COMBINED_CHUNK_SIZE)
+
+
+class CompleteRoutingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.create = mock.Mock(return_value=_fake_response('趋势'))
+        self.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=self.create)))
+
+    def _summarizer(self) -> AISummarizer:
+        summarizer = AISummarizer(provider='claude', api_key='relay-key', cache_ttl=0, warmup=False)
+        summarizer._get_openai_client = lambda: self.client
+        summarizer._chat_claude = mock.Mock(return_value='原生')
+        return summarizer
+
+    def test_claude_with_relay_uses_openai_compatible_endpoint(self):
+        with mock.patch.dict(os.environ, {'OPENAI_BASE_URL': 'https://relay.example.com'}):
+            summarizer = self._summarizer()
+        self.assertEqual(summarizer.complete('系统', '提示', max_tokens=100), '趋势')
+        summarizer._chat_claude.assert_not_called()
+        self.assertNotIn('extra_body', self.create.call_args.kwargs)
+
+    def test_claude_without_relay_uses_native_api(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop('OPENAI_BASE_URL', None)
+            summarizer = self._summarizer()
+        self.assertEqual(summarizer.complete('系统', '提示', max_tokens=100), '原生')
+        self.create.assert_not_called()
+
+    def test_warmup_follows_relay_routing(self):
+        models = mock.Mock()
+        with mock.patch.dict(os.environ, {'OPENAI_BASE_URL': 'https://relay.example.com'}):
+            summarizer = self._summarizer()
+        summarizer._get_openai_client = lambda: SimpleNamespace(models=models)
+        summarizer._get_anthropic_client = mock.Mock()
+
+        summarizer._warmup()
+        models.list.assert_called_once()
+        summarizer._get_anthropic_client.assert_not_called()
+
+    def test_gemini_without_relay_is_rejected(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop('OPENAI_BASE_URL', None)
+            summarizer = AISummarizer(provider='gemini', api_key='gemini-key', cache_ttl=0, warmup=False)
+            summarizer._get_openai_client = lambda: self.client
+            with self.assertRaises(ValueError):
+                summarizer.complete('系统', '提示', max_tokens=100)
+        self.create.assert_not_called()
+
+
+
+class CacheKeyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        patcher = mock.patch.object(disk_cache, 'CACHE_DIR', self.tmpdir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_only_title_is_case_insensitive(self):
+        summarizer = AISummarizer(provider='openai', api_key='test-key', warmup=False)
+        key = summarizer._cache_key('系统', '**标题**: Attention Is All You Need\n**摘要**: BERT', 100, 0.7,
+                                    title='Attention Is All You Need')
+        self.assertEqual(key, summarizer._cache_key('系统', '**标题**:  attention is all you need\n**摘要**: BERT',
+                                                    100, 0.7, title='attention is all you need'))
+        self.assertNotEqual(key, summarizer._cache_key('系统', '**标题**: Attention Is All You Need\n**摘要**: bert',
+                                                       100, 0.7, title='Attention Is All You Need'))
+
+    def test_zero_ttl_disables_memory_cache(self):
+        summarizer = AISummarizer(provider='openai', api_key='test-key', cache_ttl=0, warmup=False)
+        summarizer._cache_store('key', 'value')
+        self.assertIsNone(summarizer._cache_lookup('key'))
+
+
+
+class StreamRetryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        patcher = mock.patch.object(disk_cache, 'CACHE_DIR', self.tmpdir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sleep = mock.patch('ai_summarizer.time.sleep')
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def test_openai_stream_retries_transient_errors(self):
+        rate_limited = Exception('rate limited')
+        rate_limited.status_code = 429
+        chunks = [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+                  for text in ('解读', '内容')]
+        create = mock.Mock(side_effect=[rate_limited, iter(chunks)])
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+        summarizer = AISummarizer(provider='openai', api_key='test-key', warmup=False)
+        summarizer._get_openai_client = lambda: client
+        paper = HuggingFacePaperFetcher()._parse_paper(API_ITEM)
+
+        text = ''.join(summarizer.summarize_paper_stream(paper))
+        self.assertTrue(text.endswith('解读内容'))
+        self.assertEqual(create.call_count, 2)
+
+
+    def test_claude_stream_and_chat_share_normalized_cache_entry(self):
+        events = [SimpleNamespace(type='content_block_delta', delta=SimpleNamespace(type='text_delta', text=text))
+                  for text in ('  解读', '内容 \n')]
+        stream = mock.MagicMock()
+        stream.__enter__.return_value = stream
+        stream.__iter__.return_value = iter(events)
+        create = mock.Mock(return_value=stream)
+        client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+        with mock.patch.dict(os.environ):
+            os.environ.pop('OPENAI_BASE_URL', None)
+            summarizer = AISummarizer(provider='claude', api_key='test-key', warmup=False)
+        summarizer._get_anthropic_client = lambda: client
+        paper = HuggingFacePaperFetcher()._parse_paper(API_ITEM)
+
+        ''.join(summarizer.summarize_paper_stream(paper))
+        self.assertEqual(summarizer._summarize_with_claude(paper), '🤖 **Claude 解读**:\n\n解读内容')
+        self.assertEqual(create.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""经典论文公开接口的返回格式测试"""
+
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from classic_papers_extended import ClassicPaperFetcher  # noqa: E402
+
+
+class ClassicPaperAccessorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.fetcher = ClassicPaperFetcher()
+
+    def test_get_papers_returns_json_serializable_dicts(self):
+        papers = self.fetcher.get_papers()
+        self.assertTrue(papers)
+        self.assertTrue(all(type(paper) is dict and paper['is_classic'] for paper in papers))
+        json.dumps(papers, ensure_ascii=False)
+        self.assertEqual(len(self.fetcher.get_papers(limit=3)), 3)
+
+    def test_keyword_search_returns_dicts_without_classic_flag(self):
+        results = self.fetcher.get_papers_by_keyword('attention')
+        self.assertTrue(results)
+        for paper in results:
+            self.assertIs(type(paper), dict)
+            self.assertNotIn('is_classic', paper)
+        json.dumps(results, ensure_ascii=False)
+        self.assertEqual(self.fetcher.get_papers_by_keywords(['attention'])['attention'], results)
+
+    def test_records_are_shared_but_random_paper_is_a_copy(self):
+        self.assertIs(self.fetcher.get_papers(limit=1)[0], self.fetcher.get_papers(limit=1)[0])
+
+        paper = self.fetcher.get_random_paper()
+        paper['ai_summary'] = '解读'
+        self.assertTrue(all('ai_summary' not in p for p in self.fetcher.get_papers()))
+
+if __name__ == '__main__':
+    unittest.main()
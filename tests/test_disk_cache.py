@@ -0,0 +1,52 @@
+"""DiskCache 过期清理测试"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import disk_cache  # noqa: E402
+from disk_cache import DiskCache  # noqa: E402
+
+
+class DiskCacheExpiryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        patcher = mock.patch.object(disk_cache, 'CACHE_DIR', self.tmpdir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _row_count(self, path: str) -> int:
+        with sqlite3.connect(path) as conn:
+            return conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+    def test_expired_rows_are_purged_on_open(self):
+        cache = DiskCache('expiry', ttl=60)
+        with mock.patch('disk_cache.time.time', return_value=1000.0):
+            cache.set('old', 'value')
+        with mock.patch('disk_cache.time.time', return_value=1100.0):
+            cache.set('fresh', 'value')
+        self.assertEqual(self._row_count(cache.path), 2)
+
+        # 下一次运行重新打开数据库时删除过期条目
+        with mock.patch('disk_cache.time.time', return_value=1120.0):
+            reopened = DiskCache('expiry', ttl=60)
+            self.assertIsNone(reopened.get('old'))
+            self.assertEqual(reopened.get('fresh'), 'value')
+        self.assertEqual(self._row_count(cache.path), 1)
+
+    def test_no_ttl_keeps_everything(self):
+        cache = DiskCache('forever')
+        with mock.patch('disk_cache.time.time', return_value=0.0):
+            cache.set('old', 'value')
+        self.assertEqual(DiskCache('forever').get('old'), 'value')
+
+
+if __name__ == '__main__':
+    unittest.main()